@@ -52,7 +52,7 @@ __all__ = [
 
 EXTERNAL_KEY_SEPARATOR = ":"
 GLOBAL_SCOPE_WILDCARD = "*"
-NAMESPACED_KEY_PATTERN = rf"^.+{re.escape(AUTHZ_POLICY_ATTRIBUTES_SEPARATOR)}.+$"
+NAMESPACED_KEY_PATTERN = re.compile(rf"^.+{re.escape(AUTHZ_POLICY_ATTRIBUTES_SEPARATOR)}.+$")
 
 
 class GroupingPolicyIndex(Enum):
@@ -251,7 +251,7 @@ class ScopeMeta(type):
             <class 'ScopeData'>
         """
         # TODO: Default separator, can't access directly from class so made it a constant
-        if not re.match(NAMESPACED_KEY_PATTERN, namespaced_key):
+        if not NAMESPACED_KEY_PATTERN.match(namespaced_key):
             raise ValueError(f"Invalid namespaced_key format: {namespaced_key}")
 
         namespace, external_key = namespaced_key.split(AUTHZ_POLICY_ATTRIBUTES_SEPARATOR, 1)
@@ -853,7 +853,7 @@ class OrgGlobData(ScopeData):
     NAMESPACE: ClassVar[str] = "org"
     IS_ORG_GLOB: ClassVar[bool] = True
     ID_SEPARATOR: ClassVar[str]
-    ORG_NAME_VALID_PATTERN: ClassVar[re.Pattern] = r"^[a-zA-Z0-9._-]*$"
+    ORG_NAME_VALID_PATTERN: ClassVar[re.Pattern] = re.compile(r"^[a-zA-Z0-9._-]*$")
 
     @property
     def org(self) -> str | None:
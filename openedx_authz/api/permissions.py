@@ -5,13 +5,20 @@ allowed actions(s) a subject can perform on an object. In Casbin, permissions
 are not explicitly defined, but are inferred from the policy rules.
 """
 
+import time
+
+from crum import get_current_request
+from edx_django_utils.cache import RequestCache
+from edx_django_utils.monitoring import accumulate, increment
+
 from openedx_authz.api.data import ActionData, PermissionData, PolicyIndex, ScopeData, SubjectData
-from openedx_authz.engine.enforcer import AuthzEnforcer
+from openedx_authz.engine.enforcer import DECISION_CACHE_NAMESPACE, AuthzEnforcer
 
 __all__ = [
     "get_permission_from_policy",
     "get_all_permissions_in_scope",
     "is_subject_allowed",
+    "batch_is_subject_allowed",
 ]
 
 
@@ -63,4 +70,82 @@ def is_subject_allowed(
         bool: True if the subject has the specified permission in the scope, False otherwise.
     """
     enforcer = AuthzEnforcer.get_enforcer()
-    return enforcer.enforce(subject.namespaced_key, action.namespaced_key, scope.namespaced_key)
+    request = (subject.namespaced_key, action.namespaced_key, scope.namespaced_key)
+
+    # Within a request, decisions are memoized for the rest of the request. The key includes
+    # the loaded policy version, and the whole namespace is cleared when the policy is reloaded.
+    # Outside of one nothing would ever clear the cache, so decisions are never memoized there.
+    in_request = get_current_request() is not None
+    cache = RequestCache(DECISION_CACHE_NAMESPACE)
+    cache_key = (AuthzEnforcer.get_loaded_policy_version(), *request)
+    if in_request:
+        cached = cache.get_cached_response(cache_key)
+        if cached.is_found:
+            increment("authz.enforce.cache_hits")
+            return cached.value
+
+    start = time.perf_counter()
+    result = enforcer.enforce(*request)
+    increment("authz.enforce.count")
+    accumulate("authz.enforce.duration_ms", (time.perf_counter() - start) * 1000)
+
+    if in_request:
+        cache.set(cache_key, result)
+    return result
+
+
+def batch_is_subject_allowed(
+    requests: list[tuple[SubjectData, ActionData, ScopeData]],
+) -> list[bool]:
+    """Check multiple (subject, action, scope) permission requests at once.
+
+    The enforcer is retrieved (and its policy version checked) once for the whole
+    batch, and all the requests are evaluated under a single enforcer lock, instead
+    of paying both costs for every request as repeated ``is_subject_allowed`` calls do.
+
+    Within a request, decisions share the cache used by ``is_subject_allowed``: requests
+    already decided earlier in the request aren't enforced again, and new decisions are cached.
+
+    Args:
+        requests: A list of (subject, action, scope) tuples to check.
+
+    Returns:
+        list[bool]: The result for each request, in the same order as the requests.
+    """
+    if not requests:
+        return []
+
+    enforcer = AuthzEnforcer.get_enforcer()
+    in_request = get_current_request() is not None
+    cache = RequestCache(DECISION_CACHE_NAMESPACE)
+    version = AuthzEnforcer.get_loaded_policy_version()
+    cache_keys = [
+        (version, subject.namespaced_key, action.namespaced_key, scope.namespaced_key)
+        for subject, action, scope in requests
+    ]
+
+    decisions = {}
+    pending_keys = []
+    for cache_key in dict.fromkeys(cache_keys):
+        if in_request:
+            cached = cache.get_cached_response(cache_key)
+            if cached.is_found:
+                decisions[cache_key] = cached.value
+                continue
+        pending_keys.append(cache_key)
+
+    if pending_keys:
+        start = time.perf_counter()
+        results = enforcer.batch_enforce([cache_key[1:] for cache_key in pending_keys])
+        accumulate("authz.enforce.count", len(pending_keys))
+        accumulate("authz.enforce.duration_ms", (time.perf_counter() - start) * 1000)
+        for cache_key, result in zip(pending_keys, results):
+            if in_request:
+                cache.set(cache_key, result)
+            decisions[cache_key] = result
+
+    cache_hits = len(requests) - len(pending_keys)
+    if cache_hits:
+        accumulate("authz.enforce.cache_hits", cache_hits)
+
+    return [decisions[cache_key] for cache_key in cache_keys]
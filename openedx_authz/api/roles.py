@@ -83,6 +83,22 @@ def get_permissions_for_single_role(
     return [get_permission_from_policy(policy) for policy in policies]
 
 
+def _attach_role_permissions(roles: list[RoleData]) -> None:
+    """Set the permissions of each role, looking them up once per distinct role.
+
+    Role assignment listings hold one RoleData object per assignment, so the same role
+    shows up many times; resolving its permissions for every assignment is expensive.
+
+    Args:
+        roles: The RoleData objects whose permissions should be set.
+    """
+    permissions_per_role: dict[str, list[PermissionData]] = {}
+    for role in roles:
+        if role.namespaced_key not in permissions_per_role:
+            permissions_per_role[role.namespaced_key] = get_permissions_for_single_role(role)
+        role.permissions = permissions_per_role[role.namespaced_key]
+
+
 def get_permissions_for_roles(
     roles: list[RoleData],
 ) -> dict[str, dict[str, list[PermissionData | str]]]:
@@ -260,12 +276,23 @@ def assign_role_to_subject_in_scope(subject: SubjectData, role: RoleData, scope:
 def batch_assign_role_to_subjects_in_scope(subjects: list[SubjectData], role: RoleData, scope: ScopeData) -> None:
     """Assign a role to a list of subjects.
 
+    All the assignments are written in a single transaction: the batch is all-or-nothing.
+    If the assignment fails for any subject, the assignments already made for the previous
+    subjects are rolled back too, and the error is raised.
+
     Args:
         subjects: A list of subject IDs.
         role: The role to assign.
     """
-    for subject in subjects:
-        assign_role_to_subject_in_scope(subject, role, scope)
+    try:
+        with transaction.atomic():
+            for subject in subjects:
+                assign_role_to_subject_in_scope(subject, role, scope)
+    except Exception:
+        # The enforcer applied the changes in memory as they were written, and the policy
+        # version bumps were rolled back with the rest of the transaction.
+        AuthzEnforcer.force_reload()
+        raise
 
 
 def unassign_role_from_subject_in_scope(subject: SubjectData, role: RoleData, scope: ScopeData) -> bool:
@@ -311,13 +338,24 @@ def unassign_role_from_subject_in_scope(subject: SubjectData, role: RoleData, sc
 def batch_unassign_role_from_subjects_in_scope(subjects: list[SubjectData], role: RoleData, scope: ScopeData) -> None:
     """Unassign a role from a list of subjects.
 
+    All the removals are written in a single transaction: the batch is all-or-nothing.
+    If the removal fails for any subject, the removals already made for the previous
+    subjects are rolled back too, and the error is raised.
+
     Args:
         subjects: A list of subject IDs.
         role_name: The external_key of the role.
         scope: The scope from which to unassign the role.
     """
-    for subject in subjects:
-        unassign_role_from_subject_in_scope(subject, role, scope)
+    try:
+        with transaction.atomic():
+            for subject in subjects:
+                unassign_role_from_subject_in_scope(subject, role, scope)
+    except Exception:
+        # The enforcer applied the changes in memory as they were written, and the policy
+        # version bumps were rolled back with the rest of the transaction.
+        AuthzEnforcer.force_reload()
+        raise
 
 
 def get_all_subject_role_assignments() -> list[RoleAssignmentData]:
@@ -331,7 +369,6 @@ def get_all_subject_role_assignments() -> list[RoleAssignmentData]:
     for policy in enforcer.get_grouping_policy():
         subject = SubjectData(namespaced_key=policy[GroupingPolicyIndex.SUBJECT.value])
         role = RoleData(namespaced_key=policy[GroupingPolicyIndex.ROLE.value])
-        role.permissions = get_permissions_for_single_role(role)
 
         role_assignments.append(
             RoleAssignmentData(
@@ -340,6 +377,7 @@ def get_all_subject_role_assignments() -> list[RoleAssignmentData]:
                 scope=ScopeData(namespaced_key=policy[GroupingPolicyIndex.SCOPE.value]),
             )
         )
+    _attach_role_permissions([assignment.roles[0] for assignment in role_assignments])
     return role_assignments
 
 
@@ -356,7 +394,6 @@ def get_subject_role_assignments(subject: SubjectData) -> list[RoleAssignmentDat
     role_assignments = []
     for policy in enforcer.get_filtered_grouping_policy(GroupingPolicyIndex.SUBJECT.value, subject.namespaced_key):
         role = RoleData(namespaced_key=policy[GroupingPolicyIndex.ROLE.value])
-        role.permissions = get_permissions_for_single_role(role)
 
         role_assignments.append(
             RoleAssignmentData(
@@ -365,6 +402,7 @@ def get_subject_role_assignments(subject: SubjectData) -> list[RoleAssignmentDat
                 scope=ScopeData(namespaced_key=policy[GroupingPolicyIndex.SCOPE.value]),
             )
         )
+    _attach_role_permissions([assignment.roles[0] for assignment in role_assignments])
     return role_assignments
 
 
@@ -441,12 +479,8 @@ def get_role_assignments(
     field_index, field_values = _get_field_index_and_values(subject, role, scope)
     policies = enforcer.get_filtered_grouping_policy(field_index, *field_values)
 
-    _perm_cache: dict[str, list[PermissionData]] = {}
     for policy in policies:
         role = RoleData(namespaced_key=policy[GroupingPolicyIndex.ROLE.value])
-        if role.namespaced_key not in _perm_cache:
-            _perm_cache[role.namespaced_key] = get_permissions_for_single_role(role)
-        role.permissions = _perm_cache[role.namespaced_key]
         role_assignments.append(
             RoleAssignmentData(
                 subject=SubjectData(namespaced_key=policy[GroupingPolicyIndex.SUBJECT.value]),
@@ -454,6 +488,7 @@ def get_role_assignments(
                 scope=ScopeData(namespaced_key=policy[GroupingPolicyIndex.SCOPE.value]),
             )
         )
+    _attach_role_permissions([assignment.roles[0] for assignment in role_assignments])
     return role_assignments
 
 
@@ -499,6 +534,8 @@ def get_subject_role_assignments_for_role_in_scope(role: RoleData, scope: ScopeD
     """
     enforcer = AuthzEnforcer.get_enforcer()
     role_assignments = []
+    # Every assignment shares the same role, so its permissions are resolved only once
+    permissions = get_permissions_for_single_role(role)
     for subject in enforcer.get_users_for_role_in_domain(role.namespaced_key, scope.namespaced_key):
         if subject.startswith(f"{RoleData.NAMESPACE}{RoleData.SEPARATOR}"):
             # Skip roles that are also subjects
@@ -510,7 +547,7 @@ def get_subject_role_assignments_for_role_in_scope(role: RoleData, scope: ScopeD
                 roles=[
                     RoleData(
                         namespaced_key=role.namespaced_key,
-                        permissions=get_permissions_for_single_role(role),
+                        permissions=permissions,
                     )
                 ],
                 scope=scope,
@@ -537,7 +574,6 @@ def get_all_subject_role_assignments_in_scope(
     for policy in roles_in_scope:
         subject = SubjectData(namespaced_key=policy[GroupingPolicyIndex.SUBJECT.value])
         role = RoleData(namespaced_key=policy[GroupingPolicyIndex.ROLE.value])
-        role.permissions = get_permissions_for_single_role(role)
 
         if subject.external_key in role_assignments_per_subject:
             role_assignments_per_subject[subject.external_key].roles.append(role)
@@ -549,7 +585,9 @@ def get_all_subject_role_assignments_in_scope(
             scope=scope,
         )
 
-    return list(role_assignments_per_subject.values())
+    role_assignments = list(role_assignments_per_subject.values())
+    _attach_role_permissions([role for assignment in role_assignments for role in assignment.roles])
+    return role_assignments
 
 
 def get_subjects_for_role_in_scope(role: RoleData, scope: ScopeData) -> list[SubjectData]:
@@ -603,7 +641,11 @@ def unassign_subject_from_all_roles(subject: SubjectData) -> bool:
         bool: True if any roles were removed, False otherwise.
     """
     enforcer = AuthzEnforcer.get_enforcer()
-    return enforcer.remove_filtered_grouping_policy(GroupingPolicyIndex.SUBJECT.value, subject.namespaced_key)
+    success = enforcer.remove_filtered_grouping_policy(GroupingPolicyIndex.SUBJECT.value, subject.namespaced_key)
+
+    # Invalidate policy cache to ensure changes are picked up
+    AuthzEnforcer.invalidate_policy_cache()
+    return success
 
 
 def get_all_role_assignments_per_scope_type(scope_types: tuple[type[ScopeData], ...]) -> list[RoleAssignmentData]:
@@ -24,7 +24,7 @@ from openedx_authz.api.data import (
     UserAssignments,
     UserData,
 )
-from openedx_authz.api.permissions import is_subject_allowed
+from openedx_authz.api.permissions import batch_is_subject_allowed, is_subject_allowed
 from openedx_authz.api.roles import (
     assign_role_to_subject_in_scope,
     batch_assign_role_to_subjects_in_scope,
@@ -62,6 +62,7 @@ __all__ = [
     "get_visible_role_assignments_for_user",
     "get_visible_user_role_assignments_filtered_by_current_user",
     "is_user_allowed",
+    "batch_is_user_allowed",
     "is_user_allowed_in_any_scope",
     "get_scopes_for_user_and_permission",
     "get_users_for_role_in_scope",
@@ -92,6 +93,8 @@ def assign_role_to_user_in_scope(user_external_key: str, role_external_key: str,
 def batch_assign_role_to_users_in_scope(users: list[str], role_external_key: str, scope_external_key: str):
     """Assign a role to multiple users in a specific scope.
 
+    The batch is all-or-nothing: if the assignment fails for any user, no user is assigned the role.
+
     Args:
         users (list of str): List of user IDs (e.g., ['john_doe', 'jane_smith']).
         role_external_key (str): Name of the role to assign.
@@ -126,6 +129,8 @@ def unassign_role_from_user(user_external_key: str, role_external_key: str, scop
 def batch_unassign_role_from_users(users: list[str], role_external_key: str, scope_external_key: str):
     """Unassign a role from multiple users in a specific scope.
 
+    The batch is all-or-nothing: if the removal fails for any user, the role is kept for every user.
+
     Args:
         users (list of str): List of user IDs (e.g., ['john_doe', 'jane_smith']).
         role_external_key (str): Name of the role to unassign.
@@ -414,6 +419,28 @@ def is_user_allowed(
     )
 
 
+def batch_is_user_allowed(requests: list[tuple[str, str, str]]) -> list[bool]:
+    """Check multiple user permissions in their given scopes at once.
+
+    Args:
+        requests (list[tuple[str, str, str]]): A list of (user_external_key, action_external_key,
+            scope_external_key) tuples (e.g., [('john_doe', 'view_course', 'course-v1:edX+DemoX+2021_T1')]).
+
+    Returns:
+        list[bool]: Whether each user has the permission in the scope, in the same order as the requests.
+    """
+    return batch_is_subject_allowed(
+        [
+            (
+                UserData(external_key=user_external_key),
+                ActionData(external_key=action_external_key),
+                ScopeData(external_key=scope_external_key),
+            )
+            for user_external_key, action_external_key, scope_external_key in requests
+        ]
+    )
+
+
 def is_user_allowed_in_any_scope(
     user_external_key: str,
     action_external_key: str,
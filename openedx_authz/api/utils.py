@@ -1,5 +1,7 @@
 """Utility functions used on api"""
 
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
 
 from openedx_authz.api.data import (
@@ -9,38 +11,57 @@ from openedx_authz.api.data import (
 
 User = get_user_model()
 
+# Maximum number of usernames sent in a single ``username__in`` lookup
+USER_MAP_BATCH_SIZE = 500
+
 
-def get_user_map(usernames: list[str]) -> dict[str, User]:
+def get_user_map(
+    usernames: list[str],
+    with_profile: bool = False,
+    batch_size: int = USER_MAP_BATCH_SIZE,
+) -> dict[str, User]:
     """
     Retrieve a dictionary mapping usernames to User objects for efficient batch lookups.
 
-    This function performs a single optimized database query to fetch multiple users,
-    making it ideal for scenarios where we need to look up several users at once
-    (e.g., when serializing multiple user role assignments).
+    This function fetches multiple users with one query per batch of usernames, making it
+    ideal for scenarios where we need to look up several users at once (e.g., when serializing
+    multiple user role assignments). Batching keeps the ``IN`` clause within the parameter
+    limits of every supported database backend.
 
     Args:
-        usernames (list[str]): List of usernames to retrieve. Duplicates are automatically
-            handled by the database query.
+        usernames (list[str]): List of usernames to retrieve. Duplicates are removed before
+            querying the database.
+        with_profile (bool): Whether to fetch each user's profile in the same query. Only callers
+            that read ``user.profile`` should set it, since the join widens every returned row.
+        batch_size (int): Maximum number of usernames looked up per query.
 
     Returns:
         dict[str, User]: Dictionary mapping each username to its corresponding User object.
             Only users that exist in the database are included in the returned dictionary.
     """
-    users = User.objects.filter(username__in=usernames, is_active=True).select_related("profile")
-    return {user.username: user for user in users}
+    unique_usernames = list(dict.fromkeys(usernames))
+    users = User.objects.filter(is_active=True)
+    if with_profile:
+        users = users.select_related("profile")
+
+    user_map = {}
+    for start in range(0, len(unique_usernames), batch_size):
+        batch = unique_usernames[start : start + batch_size]
+        user_map.update({user.username: user for user in users.filter(username__in=batch)})
+    return user_map
 
 
 def get_user_assignment_map(role_assignments: list[RoleAssignmentData]) -> list[UserAssignments]:
     """
     Group role assignments by user
     """
-    usernames = {assignment.subject.username for assignment in role_assignments}
-    user_map = get_user_map(usernames)
-
-    users_with_assignments: list[UserAssignments] = []
+    # Bucket the assignments by user in a single pass instead of scanning all of them for every user
+    assignments_by_username: dict[str, list[RoleAssignmentData]] = defaultdict(list)
+    for assignment in role_assignments:
+        assignments_by_username[assignment.subject.username].append(assignment)
 
-    for username, user in user_map.items():
-        assignments = [a for a in role_assignments if a.subject.username == username]
-        users_with_assignments.append(UserAssignments(user=user, assignments=assignments))
+    user_map = get_user_map(list(assignments_by_username))
 
-    return users_with_assignments
+    return [
+        UserAssignments(user=user, assignments=assignments_by_username[username]) for username, user in user_map.items()
+    ]
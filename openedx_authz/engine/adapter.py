@@ -11,17 +11,25 @@ integration) and FilteredAdapter (for selective policy loading) to provide
 optimized policy management for authorization systems.
 """
 
+import logging
 from enum import Enum
+from operator import attrgetter
 
-from casbin import persist
 from casbin.model import Model
 from casbin.persist import FilteredAdapter
 from casbin_adapter.adapter import Adapter
 from casbin_adapter.models import CasbinRule
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.db.utils import OperationalError, ProgrammingError
 
 from openedx_authz.engine.filter import Filter
 
+logger = logging.getLogger(__name__)
+
+# Number of policy rows fetched from the database at a time when loading policies.
+POLICY_LOAD_CHUNK_SIZE = 2000
+
 
 class PolicyAttribute(Enum):
     """
@@ -54,6 +62,13 @@ class PolicyAttribute(Enum):
     """v5 (str): Sixth policy value."""
 
 
+POLICY_ATTRIBUTES = tuple(attr.value for attr in PolicyAttribute)
+"""tuple[str]: Names of the CasbinRule columns holding a policy, in order."""
+
+_FILTER_LOOKUPS = tuple(f"{attr}__in" for attr in POLICY_ATTRIBUTES)
+_get_filter_values = attrgetter(*POLICY_ATTRIBUTES)
+
+
 class ExtendedAdapter(Adapter, FilteredAdapter):
     """
     Extended Casbin adapter with filtering capabilities.
@@ -76,6 +91,89 @@ class ExtendedAdapter(Adapter, FilteredAdapter):
         """
         return True
 
+    def load_policy(self, model: Model) -> None:
+        """
+        Load all policy rules from the storage into the model.
+
+        Overrides the base Django adapter to stream the raw column values in chunks
+        instead of instantiating every CasbinRule and re-parsing it as a CSV line.
+
+        Args:
+            model (Model): The Casbin model to load policy rules into.
+        """
+        try:
+            rows = CasbinRule.objects.using(self.db_alias).values_list(*POLICY_ATTRIBUTES)
+            for row in rows.iterator(chunk_size=POLICY_LOAD_CHUNK_SIZE):
+                self._load_policy_row(row, model)
+        except (OperationalError, ProgrammingError) as error:
+            logger.warning(f"Could not load policy from database: {error}")
+
+    @staticmethod
+    def _load_policy_row(row: tuple[str, ...], model: Model) -> None:
+        """
+        Load a single policy row into the model.
+
+        Equivalent to ``persist.load_policy_line(str(casbin_rule), model)``, but the
+        values are appended to the model as they are instead of being joined into a
+        line and tokenized again. Empty values are skipped, like ``CasbinRule.__str__`` does.
+
+        Args:
+            row (tuple[str, ...]): The policy type followed by the policy values (v0-v5).
+            model (Model): The Casbin model to load the policy rule into.
+        """
+        ptype, *values = row
+        assertions = model.model.get(ptype[:1])
+        if assertions is None or ptype not in assertions:
+            return
+        assertions[ptype].policy.append([value for value in values if value])
+
+    def add_policies(self, sec: str, ptype: str, rules: list[list[str]]) -> None:
+        """
+        Add multiple policy rules to the storage in a single batch.
+
+        The base Django adapter only implements ``add_policy``, which makes Casbin's batch
+        APIs (``add_policies``, ``add_named_grouping_policies``, etc.) bail out without
+        persisting anything when auto-save is enabled. Implementing this method lets those
+        APIs write all rules with one ``bulk_create`` inside a single transaction instead
+        of one INSERT per rule.
+
+        Args:
+            sec (str): Policy section (``p`` or ``g``).
+            ptype (str): Policy type (e.g., ``p``, ``g``, ``g2``).
+            rules (list[list[str]]): Policy rules to add, each as a list of values.
+        """
+        lines = [self._create_policy_line(ptype, rule) for rule in rules]
+        with transaction.atomic(using=self.db_alias):
+            CasbinRule.objects.using(self.db_alias).bulk_create(lines)
+
+    def remove_policies(self, sec: str, ptype: str, rules: list[list[str]]) -> bool:
+        """
+        Remove multiple policy rules from the storage in a single batch.
+
+        Like ``add_policies``, the base Django adapter doesn't implement this method, so
+        Casbin's batch removal APIs (``remove_policies``, ``remove_named_grouping_policies``,
+        etc.) would only update the in-memory model. Each rule is matched the same way
+        ``remove_policy`` does, and all of them are deleted with a single DELETE query.
+
+        Args:
+            sec (str): Policy section (``p`` or ``g``).
+            ptype (str): Policy type (e.g., ``p``, ``g``, ``g2``).
+            rules (list[list[str]]): Policy rules to remove, each as a list of values.
+
+        Returns:
+            bool: True if any rule was removed from the storage, False otherwise.
+        """
+        query = Q()
+        for rule in rules:
+            query |= Q(ptype=ptype, **{f"v{index}": value for index, value in enumerate(rule)})
+
+        if not query:
+            return False
+
+        with transaction.atomic(using=self.db_alias):
+            rows_deleted, _ = CasbinRule.objects.using(self.db_alias).filter(query).delete()
+        return rows_deleted > 0
+
     def load_filtered_policy(
         self,
         model: Model,
@@ -98,10 +196,12 @@ class ExtendedAdapter(Adapter, FilteredAdapter):
                 Should have attributes like ptype, v0, v1, etc. with lists
                 of values to filter by.
         """
-        queryset = CasbinRule.objects.using(self.db_alias)
-        filtered_queryset = self.filter_query(queryset, filter)
-        for line in filtered_queryset:
-            persist.load_policy_line(str(line), model)
+        filtered_queryset = self.query_policy(filter)
+        # Fetch the raw column values instead of CasbinRule instances. Rows are streamed
+        # in chunks so memory doesn't grow with the size of the policy table.
+        rows = filtered_queryset.values_list(*POLICY_ATTRIBUTES)
+        for row in rows.iterator(chunk_size=POLICY_LOAD_CHUNK_SIZE):
+            self._load_policy_row(row, model)
 
     def filter_query(
         self,
@@ -123,12 +223,12 @@ class ExtendedAdapter(Adapter, FilteredAdapter):
         Returns:
             QuerySet: Filtered and ordered queryset of CasbinRule objects.
         """
-        for attr in PolicyAttribute:
-            filter_values = getattr(filter, attr.value)
-            if len(filter_values) > 0:
-                filter_kwargs = {f"{attr.value}__in": filter_values}
-                queryset = queryset.filter(**filter_kwargs)
-        return queryset.order_by("id")
+        filter_kwargs = {
+            lookup: filter_values
+            for lookup, filter_values in zip(_FILTER_LOOKUPS, _get_filter_values(filter))
+            if len(filter_values) > 0
+        }
+        return queryset.filter(**filter_kwargs).order_by("id")
 
     def query_policy(self, filter: Filter) -> QuerySet:  # pylint: disable=redefined-builtin
         """
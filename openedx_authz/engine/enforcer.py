@@ -16,20 +16,30 @@ Requires `CASBIN_MODEL` setting.
 """
 
 import logging
+import time
 from copy import deepcopy
 from uuid import uuid4
 
 from casbin import SyncedEnforcer
 from casbin.util import key_match_func
 from casbin.util.log import DEFAULT_LOGGING, configure_logging
-from casbin_adapter.enforcer import initialize_enforcer
+from crum import get_current_request
 from django.conf import settings
+from edx_django_utils.cache import RequestCache
+from edx_django_utils.monitoring import accumulate, increment
 
 from openedx_authz.engine.adapter import ExtendedAdapter
 from openedx_authz.models.engine import PolicyCacheControl
 
 logger = logging.getLogger(__name__)
 
+_POLICY_VERSION_CACHE_NAMESPACE = "authz_policy_version"
+_POLICY_VERSION_CACHE_KEY = "checked_version"
+
+# Namespace of the enforcement decisions memoized by the permissions API. It's cleared
+# whenever the policy is reloaded, since decisions of older versions can't be reused.
+DECISION_CACHE_NAMESPACE = "authz_enforcement_decisions"
+
 
 class AuthzEnforcer:
     """Singleton class to manage the Casbin SyncedEnforcer instance.
@@ -165,9 +175,22 @@ class AuthzEnforcer:
         the last load version with the version in the cache invalidation model,
         and reloads it if necessary.
 
+        Within a request, the version check is memoized for the rest of the request
+        using RequestCache, so repeated permission checks don't query the cache control
+        model every time. The request cache is only cleared when a request ends, so
+        outside of one (e.g., Celery tasks, management commands or event consumers) the
+        version is checked on every call to pick up policy changes made elsewhere.
+
         Returns:
             None
         """
+        in_request = get_current_request() is not None
+        cache = RequestCache(_POLICY_VERSION_CACHE_NAMESPACE)
+        if in_request:
+            cached = cache.get_cached_response(_POLICY_VERSION_CACHE_KEY)
+            if cached.is_found and cached.value == cls._last_policy_loaded_version:
+                return
+
         last_version = PolicyCacheControl.get_version()
 
         if last_version is None:
@@ -178,10 +201,26 @@ class AuthzEnforcer:
 
         if cls._last_policy_loaded_version is None or last_version != cls._last_policy_loaded_version:
             # Policy has been modified since last load; reload it
+            start = time.perf_counter()
             cls._enforcer.load_policy()
+            increment("authz.policy.reloads")
+            accumulate("authz.policy.reload_duration_ms", (time.perf_counter() - start) * 1000)
             cls._last_policy_loaded_version = last_version
+            RequestCache(DECISION_CACHE_NAMESPACE).clear()
             logger.info(f"Reloaded policy to version {last_version}")
 
+        if in_request:
+            cache.set(_POLICY_VERSION_CACHE_KEY, last_version)
+
+    @classmethod
+    def get_loaded_policy_version(cls):
+        """Get the version of the policy currently loaded in the enforcer.
+
+        Returns:
+            UUID: The loaded policy version, or None if no policy has been loaded yet.
+        """
+        return cls._last_policy_loaded_version
+
     @classmethod
     def invalidate_policy_cache(cls):
         """Invalidate the current policy cache to force a reload on next check.
@@ -194,8 +233,25 @@ class AuthzEnforcer:
         """
         new_version = uuid4()
         PolicyCacheControl.set_version(new_version)
+        RequestCache(_POLICY_VERSION_CACHE_NAMESPACE).clear()
         logger.info(f"Invalidated policy cache to version {new_version}")
 
+    @classmethod
+    def force_reload(cls) -> SyncedEnforcer:
+        """Reload the policy right away and make other processes reload it too.
+
+        Use it when the in-memory policy can't be trusted anymore, e.g., after a
+        transaction that changed policies was rolled back. The reload goes through
+        ``load_policy_if_needed``, so the loaded version is tracked and the memoized
+        enforcement decisions are cleared.
+
+        Returns:
+            SyncedEnforcer: The singleton enforcer instance, with the policy reloaded.
+        """
+        cls._last_policy_loaded_version = None
+        cls.invalidate_policy_cache()
+        return cls.get_enforcer()
+
     @classmethod
     def get_enforcer(cls) -> SyncedEnforcer:
         """Get the enforcer instance, creating it if needed.
@@ -233,7 +289,7 @@ class AuthzEnforcer:
 
         This method initializes the SyncedEnforcer with the ExtendedAdapter
         for database policy storage and automatic policy synchronization.
-        It also initializes the enforcer with the specified database alias from settings.
+        The adapter uses the database alias specified in settings.
 
         Returns:
             SyncedEnforcer: Configured Casbin enforcer with adapter and auto-sync
@@ -241,22 +297,14 @@ class AuthzEnforcer:
         # Avoid circular import
         from openedx_authz.engine.matcher import is_admin_or_superuser_check  # pylint: disable=import-outside-toplevel
 
-        # Configure logging BEFORE initialize_enforcer() because it creates a ProxyEnforcer
-        # that doesn't pass logging config and would use Casbin's defaults
         cls._configure_logging()
 
+        # The enforcer is lazily created on first use, never at import time or in
+        # AppConfig.ready(), so process startup doesn't pay for a policy load. We don't
+        # call casbin_adapter's initialize_enforcer() here: it would load the whole
+        # policy table into the upstream global enforcer, which this app never uses.
         db_alias = getattr(settings, "CASBIN_DB_ALIAS", "default")
-
-        try:
-            # Initialize the enforcer with the specified database alias to set up the adapter.
-            # Best to lazy load it when it's first used to ensure the database is ready and avoid
-            # issues when the app is not fully loaded (e.g., while pulling translations, etc.).
-            initialize_enforcer(db_alias)
-        except Exception as e:
-            logger.error(f"Failed to initialize Casbin enforcer with DB alias '{db_alias}': {e}")
-            raise
-
-        adapter = ExtendedAdapter()
+        adapter = ExtendedAdapter(db_alias)
         enforcer = SyncedEnforcer(settings.CASBIN_MODEL, adapter)
         enforcer.add_function("is_staff_or_superuser", is_admin_or_superuser_check)
         enforcer.add_named_domain_matching_func("g", key_match_func)
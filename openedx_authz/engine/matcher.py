@@ -1,5 +1,7 @@
 """Custom condition checker. Note only used for data_library scope"""
 
+from functools import lru_cache
+
 from openedx_authz.api.data import (
     ContentLibraryData,
     CourseOverviewData,
@@ -22,6 +24,30 @@ SCOPES_WITH_ADMIN_OR_SUPERUSER_CHECK = {
 }
 
 
+@lru_cache(maxsize=4096)
+def scope_requires_admin_or_superuser_check(request_scope: str) -> bool:
+    """Check whether a scope grants access to staff and superusers.
+
+    The result only depends on the scope key and the registered scope classes, so
+    it's memoized: the matcher evaluates the same scopes for every policy row and
+    every request, and resolving the scope class parses and validates the key.
+
+    Args:
+        request_scope (str): Namespaced scope key (format: "scope_type^<scope_id>")
+
+    Returns:
+        bool: True if the scope type is in SCOPES_WITH_ADMIN_OR_SUPERUSER_CHECK, False otherwise.
+
+    Raises:
+        ValueError: If the scope key is malformed or its namespace isn't registered.
+    """
+    scope = ScopeData(namespaced_key=request_scope)
+
+    # TODO: This special case for superuser and staff users is currently only for
+    # content libraries and course overviews. See: https://github.com/openedx/openedx-authz/issues/87
+    return (scope.NAMESPACE, type(scope)) in SCOPES_WITH_ADMIN_OR_SUPERUSER_CHECK
+
+
 def is_admin_or_superuser_check(request_user: str, request_action: str, request_scope: str) -> bool:  # pylint: disable=unused-argument
     """
     Evaluates custom, non-role-based conditions for authorization checks.
@@ -40,13 +66,8 @@ def is_admin_or_superuser_check(request_user: str, request_action: str, request_
               ContentLibraryData and CourseOverviewData scopes), False otherwise (including when user
               doesn't exist or scope type is not supported)
     """
-
-    scope = ScopeData(namespaced_key=request_scope)
-    username = UserData(namespaced_key=request_user).external_key
-
-    # TODO: This special case for superuser and staff users is currently only for
-    # content libraries and course overviews. See: https://github.com/openedx/openedx-authz/issues/87
-    if (scope.NAMESPACE, type(scope)) not in SCOPES_WITH_ADMIN_OR_SUPERUSER_CHECK:
+    if not scope_requires_admin_or_superuser_check(request_scope):
         return False
 
+    username = UserData(namespaced_key=request_user).external_key
     return is_user_staff_or_superuser(username)
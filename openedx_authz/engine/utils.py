@@ -81,6 +81,58 @@ class MigrationMetadata:
         return {k: v for k, v in self.__dict__.items() if v}
 
 
+def _get_missing_rules(rules: list[list[str]], existing_rules: list[list[str]]) -> list[list[str]]:
+    """Get the rules that are not part of the existing rules.
+
+    Uses a set of the existing rules so each lookup is constant time instead of a
+    linear scan over the enforcer's policy list, which is what ``has_policy`` does.
+    Duplicated rules are only returned once and the original order is preserved.
+
+    Args:
+        rules (list[list[str]]): The candidate rules.
+        existing_rules (list[list[str]]): The rules already present in the target.
+
+    Returns:
+        list[list[str]]: The candidate rules missing from the existing rules.
+    """
+    seen = {tuple(rule) for rule in existing_rules}
+    missing_rules = []
+    for rule in rules:
+        if tuple(rule) in seen:
+            continue
+        seen.add(tuple(rule))
+        missing_rules.append(rule)
+    return missing_rules
+
+
+def _add_rules_to_enforcer(enforcer: Enforcer, ptype: str, rules: list[list[str]]) -> int:
+    """Add rules of the given ptype to the enforcer, in a single batch when possible.
+
+    Casbin's batch methods return False without adding anything when the adapter
+    doesn't implement ``add_policies`` or when any of the rules already exists. In
+    that case the rules are added one by one, so every rule that can be added is.
+
+    Args:
+        enforcer (Enforcer): The Casbin enforcer instance to add the rules to.
+        ptype (str): The policy type of the rules (e.g., "p", "g", "g2").
+        rules (list[list[str]]): The rules to add.
+
+    Returns:
+        int: The number of rules actually added to the enforcer.
+    """
+    is_grouping_policy = ptype in GROUPING_POLICY_PTYPES
+    if is_grouping_policy:
+        batch_added = enforcer.add_named_grouping_policies(ptype, rules)
+    else:
+        batch_added = enforcer.add_named_policies(ptype, rules)
+    if batch_added:
+        return len(rules)
+
+    logger.warning(f"Could not add {ptype} rules in a single batch, adding them one by one.")
+    add_rule = enforcer.add_named_grouping_policy if is_grouping_policy else enforcer.add_named_policy
+    return sum(1 for rule in rules if add_rule(ptype, rule))
+
+
 def migrate_policy_between_enforcers(
     source_enforcer: Enforcer,
     target_enforcer: Enforcer,
@@ -101,36 +153,25 @@ def migrate_policy_between_enforcers(
         target_enforcer.load_policy()
         logger.info(f"Target enforcer has {len(target_enforcer.get_policy())} existing policies before migration.")
 
-        # TODO: this operations use the enforcer directly, which may not be ideal
-        # since we have to load the policy after each addition to avoid duplicates.
-        # I think we should consider using an API which can validate whether
-        # all policies exist before adding them or we have the
-        # latest policies loaded in the enforcer.
+        new_policies = _get_missing_rules(policies, target_enforcer.get_policy())
+        logger.info(f"Skipping {len(policies) - len(new_policies)} policies already in target.")
 
-        for policy in policies:
-            if target_enforcer.has_policy(*policy):
-                logger.info(f"Policy {policy} already exists in target, skipping.")
-                continue
-            target_enforcer.add_policy(*policy)
-
-            # Ensure latest policies are loaded in the target enforcer after each addition
-            # to avoid duplicates
-            target_enforcer.load_policy()
+        # Add all the missing policies in a single batch so they are persisted with
+        # one write instead of one write (and policy reload) per rule.
+        if new_policies:
+            added = _add_rules_to_enforcer(target_enforcer, "p", new_policies)
+            logger.info(f"Added {added} policies to target enforcer.")
 
         for grouping_policy_ptype in GROUPING_POLICY_PTYPES:
             try:
                 grouping_policies = source_enforcer.get_named_grouping_policy(grouping_policy_ptype)
-                for grouping in grouping_policies:
-                    if target_enforcer.has_named_grouping_policy(grouping_policy_ptype, *grouping):
-                        logger.info(
-                            f"Grouping policy {grouping_policy_ptype}, {grouping} already exists in target, skipping."
-                        )
-                        continue
-                    target_enforcer.add_named_grouping_policy(grouping_policy_ptype, *grouping)
-
-                    # Ensure latest policies are loaded in the target enforcer after each addition
-                    # to avoid duplicates
-                    target_enforcer.load_policy()
+                new_grouping_policies = _get_missing_rules(
+                    grouping_policies,
+                    target_enforcer.get_named_grouping_policy(grouping_policy_ptype),
+                )
+                if new_grouping_policies:
+                    added = _add_rules_to_enforcer(target_enforcer, grouping_policy_ptype, new_grouping_policies)
+                    logger.info(f"Added {added} {grouping_policy_ptype} grouping policies to target enforcer.")
             except KeyError as e:
                 logger.info(f"Skipping {grouping_policy_ptype} policies: {e} not found in source enforcer.")
         logger.info(f"Successfully loaded policies from {source_enforcer.get_model()} into the database.")
@@ -164,23 +205,25 @@ def migrate_legacy_permissions(ContentLibraryPermission):
     param ContentLibraryPermission: The ContentLibraryPermission model to use.
     """
 
-    legacy_permissions = ContentLibraryPermission.objects.select_related(
-        "library", "library__org", "user", "group"
-    ).all()
+    # Group members are prefetched so reading them doesn't issue one query per group permission
+    legacy_permissions = (
+        ContentLibraryPermission.objects.select_related("library", "library__org", "user", "group")
+        .prefetch_related("group__user_set")
+        .all()
+    )
+
+    # Derive equivalent role based on access level
+    access_level_to_role = {
+        "admin": LIBRARY_ADMIN,
+        "author": LIBRARY_AUTHOR,
+        "read": LIBRARY_USER,
+    }
 
     # List to keep track of any permissions that could not be migrated
     permissions_with_errors = []
 
     for permission in legacy_permissions:
         # Migrate the permission to the new model
-
-        # Derive equivalent role based on access level
-        access_level_to_role = {
-            "admin": LIBRARY_ADMIN,
-            "author": LIBRARY_AUTHOR,
-            "read": LIBRARY_USER,
-        }
-
         role = access_level_to_role.get(permission.access_level)
         if role is None:
             # This should not happen as there are no more access_levels defined
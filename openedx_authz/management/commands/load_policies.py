@@ -137,8 +137,12 @@ class Command(BaseCommand):
         Args:
             target_enforcer: The Casbin enforcer instance to delete permissions inheritance from.
         """
-        list_of_permissions = target_enforcer.get_named_grouping_policy("g2")
-        for permission in list(list_of_permissions):
-            result = target_enforcer.remove_named_grouping_policy("g2", *permission)
-            if result:
+        # Copy the rules, the enforcer returns its internal policy list which is mutated on removal
+        list_of_permissions = list(target_enforcer.get_named_grouping_policy("g2"))
+        if not list_of_permissions:
+            return
+
+        result = target_enforcer.remove_named_grouping_policies("g2", list_of_permissions)
+        if result:
+            for permission in list_of_permissions:
                 click.echo(f"Deleted permission inheritance: {permission}")
@@ -0,0 +1,38 @@
+"""
+Add a composite index on the casbin_rule table used to store policies.
+
+The casbin_rule table is owned by the casbin_adapter app, which doesn't define any
+index besides the primary key, so every filtered policy lookup (by policy type and
+subject/role) was a full table scan. The index is created through the schema editor
+so it works on every supported database backend.
+
+The index is limited to (ptype, v0, v1): with utf8mb4 each CharField(255) column takes
+up to 1020 bytes, and MySQL caps index keys at 3072 bytes.
+"""
+
+from django.db import migrations, models
+
+CASBIN_RULE_INDEX = models.Index(fields=["ptype", "v0", "v1"], name="casbin_rule_ptype_v0_v1_idx")
+
+
+def add_casbin_rule_index(apps, schema_editor):
+    """Create the composite index on the casbin_rule table."""
+    CasbinRule = apps.get_model("casbin_adapter", "CasbinRule")
+    schema_editor.add_index(CasbinRule, CASBIN_RULE_INDEX)
+
+
+def remove_casbin_rule_index(apps, schema_editor):
+    """Drop the composite index from the casbin_rule table."""
+    CasbinRule = apps.get_model("casbin_adapter", "CasbinRule")
+    schema_editor.remove_index(CasbinRule, CASBIN_RULE_INDEX)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("casbin_adapter", "0001_initial"),
+        ("openedx_authz", "0009_roleassignmentaudit"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_casbin_rule_index, remove_casbin_rule_index),
+    ]
@@ -56,18 +56,7 @@ def sort_users(
     Returns:
         list[dict]: The sorted users.
     """
-    if sort_by not in SortField.values():
-        raise ValueError(f"Invalid field: '{sort_by}'. Must be one of {SortField.values()}")
-
-    if order not in SortOrder.values():
-        raise ValueError(f"Invalid order: '{order}'. Must be one of {SortOrder.values()}")
-
-    sorted_users = sorted(
-        users,
-        key=lambda user: (user.get(sort_by) or "").lower(),
-        reverse=order == SortOrder.DESC,
-    )
-    return sorted_users
+    return _sort_by_field(users, sort_by, order, SortField)
 
 
 def filter_users(users: list[dict], search: str | None, roles: list[str] | None) -> list[dict]:
@@ -85,17 +74,20 @@ def filter_users(users: list[dict], search: str | None, roles: list[str] | None)
     if not search and not roles:
         return users
 
+    # Resolve the loop invariants once instead of once per user
+    search_fields = SearchField.values()
+    search = search.lower() if search else search
+    role_set = frozenset(roles) if roles else None
+
     filtered_users = []
     for user in users:
         if search:
-            matches_search = any(search in (user.get(field) or "").lower() for field in SearchField.values())
+            matches_search = any(search in (user.get(field) or "").lower() for field in search_fields)
             if not matches_search:
                 continue
 
-        if roles:
-            matches_role = any(role in user.get("roles", []) for role in roles)
-            if not matches_role:
-                continue
+        if role_set and role_set.isdisjoint(user.get("roles") or ()):
+            continue
 
         filtered_users.append(user)
 
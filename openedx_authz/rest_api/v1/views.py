@@ -326,7 +326,7 @@ class RoleUserAPIView(APIView):
 
         user_role_assignments = api.get_all_user_role_assignments_in_scope(query_params["scope"])
         usernames = {assignment.subject.username for assignment in user_role_assignments}
-        context = {"user_map": get_user_map(usernames)}
+        context = {"user_map": get_user_map(usernames, with_profile=True)}
         serialized_data = UserRoleAssignmentSerializer(user_role_assignments, many=True, context=context)
 
         filtered_users = filter_users(serialized_data.data, query_params["search"], query_params["roles"])
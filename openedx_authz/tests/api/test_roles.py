@@ -11,6 +11,7 @@ from unittest.mock import patch
 import casbin
 from ddt import data as ddt_data
 from ddt import ddt, unpack
+from django.db import IntegrityError
 from django.test import TestCase
 
 from openedx_authz.api.data import (
@@ -26,6 +27,7 @@ from openedx_authz.api.roles import (
     _get_field_index_and_values,
     assign_role_to_subject_in_scope,
     batch_assign_role_to_subjects_in_scope,
+    batch_unassign_role_from_subjects_in_scope,
     filter_role_assignments_visible_to_subject,
     get_all_subject_role_assignments,
     get_all_subject_role_assignments_in_scope,
@@ -774,6 +776,26 @@ class TestRolesAPI(RolesTestSetupMixin):
                     f"Expected scope {scope_name}, got {assignment.scope.external_key}",
                 )
 
+    def test_get_all_subject_role_assignments_resolves_permissions_once_per_role(self):
+        """Test that role permissions are resolved once per distinct role, not once per assignment.
+
+        Expected result:
+            - get_permissions_for_single_role is called once for each distinct role
+            - Assignments sharing a role get the same permissions
+        """
+        with patch(
+            "openedx_authz.api.roles.get_permissions_for_single_role",
+            wraps=get_permissions_for_single_role,
+        ) as mock_get_permissions:
+            role_assignments = get_all_subject_role_assignments()
+
+        distinct_roles = {assignment.roles[0].namespaced_key for assignment in role_assignments}
+        self.assertGreater(len(role_assignments), len(distinct_roles))
+        self.assertEqual(mock_get_permissions.call_count, len(distinct_roles))
+        for assignment in role_assignments:
+            role = assignment.roles[0]
+            self.assertEqual(role.permissions, get_permissions_for_single_role(role))
+
     @ddt_data(
         # Test case: alice with 'view_library' permission (has library_admin in math_101)
         (
@@ -1385,6 +1407,75 @@ class TestRoleAssignmentAPI(RolesTestSetupMixin):
         self.assertFalse(result)
         mock_on_commit.assert_not_called()
 
+    def test_batch_assign_role_is_written_in_a_single_transaction(self):
+        """A failure in the middle of a batch assignment rolls back the whole batch.
+
+        Expected result:
+            - The error from the failing assignment is propagated.
+            - No ExtendedCasbinRule is kept for the subjects assigned before the failure.
+            - The enforcer keeps no policy for the subjects assigned before the failure.
+        """
+        subjects = [SubjectData(external_key="batch_user_1"), SubjectData(external_key="batch_user_2")]
+        role = RoleData(external_key=roles.LIBRARY_USER.external_key)
+        scope = ScopeData(external_key="lib:Org1:math_101")
+        create_based_on_policy = ExtendedCasbinRule.create_based_on_policy
+        enforcer = AuthzEnforcer.get_enforcer()
+
+        def fail_for_second_subject(subject, *args):
+            if subject == subjects[1]:
+                raise IntegrityError("Failed to store the assignment")
+            return create_based_on_policy(subject, *args)
+
+        with patch(
+            "openedx_authz.models.ExtendedCasbinRule.create_based_on_policy",
+            side_effect=fail_for_second_subject,
+        ) as mock_create:
+            with self.assertRaisesMessage(IntegrityError, "Failed to store the assignment"):
+                batch_assign_role_to_subjects_in_scope(subjects, role, scope)
+
+        self.assertEqual(mock_create.call_count, 2)
+        self.assertFalse(
+            ExtendedCasbinRule.objects.filter(casbin_rule_key__contains=subjects[0].namespaced_key).exists()
+        )
+        self.assertEqual(enforcer.get_filtered_grouping_policy(0, subjects[0].namespaced_key), [])
+        self.assertFalse(
+            enforcer.enforce(
+                subjects[0].namespaced_key,
+                ActionData(external_key=permissions.VIEW_LIBRARY.identifier).namespaced_key,
+                scope.namespaced_key,
+            )
+        )
+
+    def test_batch_unassign_role_is_written_in_a_single_transaction(self):
+        """A failure in the middle of a batch removal rolls back the whole batch.
+
+        Expected result:
+            - The error from the failing removal is propagated.
+            - The enforcer keeps the assignments of the subjects removed before the failure.
+        """
+        subjects = [SubjectData(external_key="batch_user_1"), SubjectData(external_key="batch_user_2")]
+        role = RoleData(external_key=roles.LIBRARY_USER.external_key)
+        scope = ScopeData(external_key="lib:Org1:math_101")
+        batch_assign_role_to_subjects_in_scope(subjects, role, scope)
+        enforcer = AuthzEnforcer.get_enforcer()
+
+        def fail_for_second_subject(subject, *args):
+            if subject == subjects[1]:
+                raise IntegrityError("Failed to remove the assignment")
+            return unassign_role_from_subject_in_scope(subject, *args)
+
+        with patch(
+            "openedx_authz.api.roles.unassign_role_from_subject_in_scope",
+            side_effect=fail_for_second_subject,
+        ):
+            with self.assertRaisesMessage(IntegrityError, "Failed to remove the assignment"):
+                batch_unassign_role_from_subjects_in_scope(subjects, role, scope)
+
+        self.assertEqual(
+            enforcer.get_filtered_grouping_policy(0, subjects[0].namespaced_key),
+            [[subjects[0].namespaced_key, role.namespaced_key, scope.namespaced_key]],
+        )
+
 
 @ddt
 class TestFieldIndexAndValues(TestCase):
@@ -2,8 +2,11 @@
 
 from unittest.mock import Mock, patch
 
+from crum import set_current_request
 from ddt import data, ddt, unpack
 from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from edx_django_utils.cache import RequestCache
 
 from openedx_authz.api.data import (
     ContentLibraryData,
@@ -21,6 +24,7 @@ from openedx_authz.api.users import (
     _filter_candidate_assignments_by_params,
     assign_role_to_user_in_scope,
     batch_assign_role_to_users_in_scope,
+    batch_is_user_allowed,
     batch_unassign_role_from_users,
     get_all_user_role_assignments_in_scope,
     get_user_role_assignments,
@@ -38,6 +42,7 @@ from openedx_authz.api.users import (
 )
 from openedx_authz.constants import permissions, roles
 from openedx_authz.constants.roles import LIBRARY_ADMIN_PERMISSIONS, LIBRARY_AUTHOR_PERMISSIONS
+from openedx_authz.engine.enforcer import DECISION_CACHE_NAMESPACE, AuthzEnforcer
 from openedx_authz.tests.api.test_roles import RolesTestSetupMixin
 
 
@@ -606,6 +611,137 @@ class TestUserPermissions(UserAssignmentsSetupMixin):
         )
         self.assertEqual(result, expected_result)
 
+    def _start_request(self):
+        """Set a current request for the rest of the test, so decisions are memoized."""
+        set_current_request(RequestFactory().get("/"))
+        self.addCleanup(set_current_request, None)
+        RequestCache.clear_all_namespaces()
+
+    def test_is_user_allowed_memoizes_decisions_per_request(self):
+        """Test that repeated permission checks within a request are only enforced once.
+
+        Expected result:
+            - The enforcer evaluates the request only on the first check.
+            - Every check returns the same decision.
+        """
+        self._start_request()
+        enforcer = AuthzEnforcer.get_enforcer()
+
+        with patch.object(enforcer, "enforce", wraps=enforcer.enforce) as mock_enforce:
+            results = [
+                is_user_allowed(
+                    user_external_key="alice",
+                    action_external_key=permissions.DELETE_LIBRARY.identifier,
+                    scope_external_key="lib:Org1:math_101",
+                )
+                for _ in range(3)
+            ]
+
+        self.assertEqual(results, [True, True, True])
+        mock_enforce.assert_called_once()
+
+    @patch("openedx_authz.api.permissions.accumulate")
+    @patch("openedx_authz.api.permissions.increment")
+    def test_is_user_allowed_reports_monitoring_attributes(self, mock_increment, mock_accumulate):
+        """Test that permission checks report enforcement and cache-hit custom attributes.
+
+        Expected result:
+            - The first check is counted as an enforcement and its duration is accumulated.
+            - The repeated check is counted as a cache hit.
+        """
+        self._start_request()
+
+        for _ in range(2):
+            is_user_allowed(
+                user_external_key="alice",
+                action_external_key=permissions.DELETE_LIBRARY.identifier,
+                scope_external_key="lib:Org1:math_101",
+            )
+
+        self.assertEqual(
+            [call.args[0] for call in mock_increment.call_args_list],
+            ["authz.enforce.count", "authz.enforce.cache_hits"],
+        )
+        mock_accumulate.assert_called_once()
+        self.assertEqual(mock_accumulate.call_args.args[0], "authz.enforce.duration_ms")
+
+    def test_batch_is_user_allowed(self):
+        """Test checking several user permissions in a single batch.
+
+        Expected result:
+            - The results match checking each request individually, in request order.
+        """
+        requests = [
+            ("alice", permissions.DELETE_LIBRARY.identifier, "lib:Org1:math_101"),
+            ("charlie", permissions.DELETE_LIBRARY.identifier, "lib:Org1:science_301"),
+            ("carlos", permissions.COURSES_MANAGE_ADVANCED_SETTINGS.identifier, "course-v1:TestOrg+TestCourse+2024_T2"),
+            ("oscar", permissions.EDIT_LIBRARY_CONTENT.identifier, "lib:Org4:art_101"),
+        ]
+
+        results = batch_is_user_allowed(requests)
+
+        self.assertEqual(results, [True, False, True, False])
+        self.assertEqual(results, [is_user_allowed(*request) for request in requests])
+
+    def test_batch_is_user_allowed_empty(self):
+        """Test that an empty batch returns no results.
+
+        Expected result:
+            - An empty list is returned.
+        """
+        self.assertEqual(batch_is_user_allowed([]), [])
+
+    def test_batch_is_user_allowed_shares_decision_cache(self):
+        """Test that batch and single permission checks share the per-request decision cache.
+
+        Expected result:
+            - The batch only enforces the requests that weren't decided earlier, once each.
+            - Single checks reuse the decisions made by the batch.
+        """
+        self._start_request()
+        decided = ("alice", permissions.DELETE_LIBRARY.identifier, "lib:Org1:math_101")
+        pending = ("charlie", permissions.DELETE_LIBRARY.identifier, "lib:Org1:science_301")
+        is_user_allowed(*decided)
+        enforcer = AuthzEnforcer.get_enforcer()
+
+        with patch.object(enforcer, "batch_enforce", wraps=enforcer.batch_enforce) as mock_batch_enforce:
+            results = batch_is_user_allowed([decided, pending, pending])
+        with patch.object(enforcer, "enforce", wraps=enforcer.enforce) as mock_enforce:
+            single_result = is_user_allowed(*pending)
+
+        self.assertEqual(results, [True, False, False])
+        self.assertFalse(single_result)
+        mock_batch_enforce.assert_called_once()
+        self.assertEqual(len(mock_batch_enforce.call_args.args[0]), 1)
+        mock_enforce.assert_not_called()
+
+    def test_decisions_are_not_memoized_outside_requests(self):
+        """Test that permission checks outside a request don't use the decision cache.
+
+        Outside a request (e.g., in Celery tasks) nothing clears the request cache, so it
+        would keep growing and keep stale decisions.
+
+        Expected result:
+            - Every single and batch check is enforced.
+            - No decision is stored in the decision cache.
+        """
+        RequestCache.clear_all_namespaces()
+        request = ("alice", permissions.DELETE_LIBRARY.identifier, "lib:Org1:math_101")
+        enforcer = AuthzEnforcer.get_enforcer()
+
+        with (
+            patch.object(enforcer, "enforce", wraps=enforcer.enforce) as mock_enforce,
+            patch.object(enforcer, "batch_enforce", wraps=enforcer.batch_enforce) as mock_batch_enforce,
+        ):
+            single_results = [is_user_allowed(*request) for _ in range(2)]
+            batch_results = [batch_is_user_allowed([request]) for _ in range(2)]
+
+        self.assertEqual(single_results, [True, True])
+        self.assertEqual(batch_results, [[True], [True]])
+        self.assertEqual(mock_enforce.call_count, 2)
+        self.assertEqual(mock_batch_enforce.call_count, 2)
+        self.assertEqual(RequestCache(DECISION_CACHE_NAMESPACE).data, {})
+
     @data(
         # alice is library_admin on lib:Org1:math_101, so she holds these in at least one scope.
         ("alice", permissions.DELETE_LIBRARY.identifier, True),
@@ -0,0 +1,70 @@
+"""Test cases for the API utility functions."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from openedx_authz.api.utils import get_user_map
+from openedx_authz.tests.stubs.models import UserProfile
+
+User = get_user_model()
+
+
+class TestGetUserMap(TestCase):
+    """Test cases for the get_user_map function."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(username="alice", email="alice@example.com")
+        cls.bob = User.objects.create_user(username="bob", email="bob@example.com")
+        User.objects.create_user(username="carol", email="carol@example.com", is_active=False)
+        UserProfile.objects.create(user=cls.alice, name="Alice Liddell")
+
+    def test_get_user_map_returns_active_users_by_username(self):
+        """Test that only existing, active users are returned, keyed by username.
+
+        Expected result:
+            - Unknown and inactive usernames are left out of the map
+        """
+        user_map = get_user_map(["alice", "bob", "carol", "unknown"])
+
+        self.assertEqual(user_map, {"alice": self.alice, "bob": self.bob})
+
+    def test_get_user_map_does_not_join_profile_by_default(self):
+        """Test that the profile is only loaded when the caller asks for it.
+
+        Expected result:
+            - Without with_profile, reading the profile issues an extra query
+            - With with_profile, the profile is fetched in the same query as the user
+        """
+        with self.assertNumQueries(1):
+            user_map = get_user_map(["alice"])
+        with self.assertNumQueries(1):
+            self.assertEqual(user_map["alice"].profile.name, "Alice Liddell")
+
+        with self.assertNumQueries(1):
+            user_map = get_user_map(["alice"], with_profile=True)
+        with self.assertNumQueries(0):
+            self.assertEqual(user_map["alice"].profile.name, "Alice Liddell")
+
+    def test_get_user_map_queries_usernames_in_batches(self):
+        """Test that usernames are deduplicated and looked up in bounded batches.
+
+        Expected result:
+            - One query is issued per batch of unique usernames
+            - Users from every batch are merged into a single map
+        """
+        usernames = ["alice", "bob", "alice", "carol", "bob", "unknown"]
+
+        with self.assertNumQueries(2):
+            user_map = get_user_map(usernames, batch_size=2)
+
+        self.assertEqual(user_map, {"alice": self.alice, "bob": self.bob})
+
+    def test_get_user_map_with_no_usernames(self):
+        """Test that an empty list of usernames does not hit the database.
+
+        Expected result:
+            - An empty map is returned without any query
+        """
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_map([]), {})
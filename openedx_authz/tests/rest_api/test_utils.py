@@ -3,7 +3,7 @@
 from django.test import TestCase
 
 from openedx_authz.rest_api.data import AssignmentSortField
-from openedx_authz.rest_api.utils import sort_assignments
+from openedx_authz.rest_api.utils import filter_users, sort_assignments
 
 
 class TestSortAssignments(TestCase):
@@ -24,3 +24,37 @@ class TestSortAssignments(TestCase):
 
         self.assertIn("invalid_order", str(ctx.exception))
         self.assertIn("Invalid order", str(ctx.exception))
+
+
+class TestFilterUsers(TestCase):
+    """Tests for filter_users."""
+
+    users = [
+        {"username": "alice", "full_name": "Alice Liddell", "email": "alice@example.com", "roles": ["library_admin"]},
+        {"username": "bob", "full_name": None, "email": "bob@example.com", "roles": ["library_user"]},
+        {"username": "carol", "full_name": "Carol Alison", "email": "carol@example.org", "roles": []},
+    ]
+
+    def test_no_filters_returns_users_unchanged(self):
+        """Without a search term or roles the input list is returned as is."""
+        self.assertIs(filter_users(self.users, search=None, roles=None), self.users)
+
+    def test_search_is_case_insensitive_across_search_fields(self):
+        """The search term matches username, full name or email regardless of case."""
+        filtered = filter_users(self.users, search="ALI", roles=None)
+
+        self.assertEqual([user["username"] for user in filtered], ["alice", "carol"])
+
+    def test_search_and_roles_are_combined(self):
+        """Users must match both the search term and one of the roles."""
+        filtered = filter_users(self.users, search="example.com", roles=["library_user", "library_author"])
+
+        self.assertEqual([user["username"] for user in filtered], ["bob"])
+
+    def test_roles_filter_skips_users_without_roles(self):
+        """Users with missing or empty roles never match a roles filter."""
+        users = [*self.users, {"username": "dave", "roles": None}]
+
+        filtered = filter_users(users, search=None, roles=["library_admin", "library_user"])
+
+        self.assertEqual([user["username"] for user in filtered], ["alice", "bob"])
@@ -6,6 +6,7 @@ various aspects of the permission model.
 """
 
 import os
+from functools import cache
 from typing import TypedDict
 from unittest import TestCase
 
@@ -18,6 +19,7 @@ from django.contrib.auth import get_user_model
 from openedx_authz import ROOT_DIRECTORY
 from openedx_authz.api.data import (
     GLOBAL_SCOPE_WILDCARD,
+    CCXCourseOverviewData,
     ContentLibraryData,
     CourseOverviewData,
 )
@@ -28,7 +30,7 @@ from openedx_authz.constants.permissions import (
     MANAGE_LIBRARY_TEAM,
     VIEW_LIBRARY,
 )
-from openedx_authz.engine.matcher import is_admin_or_superuser_check
+from openedx_authz.engine.matcher import is_admin_or_superuser_check, scope_requires_admin_or_superuser_check
 from openedx_authz.tests.test_utils import (
     make_action_key,
     make_course_assignment,
@@ -46,6 +48,8 @@ from openedx_authz.tests.test_utils import (
 
 User = get_user_model()
 
+MODEL_FILE = os.path.join(ROOT_DIRECTORY, "engine", "config", "model.conf")
+
 
 class AuthRequest(TypedDict):
     """
@@ -68,6 +72,29 @@ COMMON_ACTION_GROUPING = [
 ]
 
 
+@cache
+def get_shared_enforcer() -> casbin.Enforcer:
+    """
+    Build the Casbin enforcer shared by every enforcement test case.
+
+    The model file is parsed only once per test session; each test case loads its own
+    policy into the shared enforcer before enforcing.
+
+    Returns:
+        casbin.Enforcer: The enforcer configured with the model.conf and custom functions.
+
+    Raises:
+        FileNotFoundError: If the model file does not exist.
+    """
+    if not os.path.isfile(MODEL_FILE):
+        raise FileNotFoundError(f"Model file not found: {MODEL_FILE}")
+
+    enforcer = casbin.Enforcer(MODEL_FILE)
+    enforcer.add_function("is_staff_or_superuser", is_admin_or_superuser_check)
+    enforcer.add_named_domain_matching_func("g", key_match_func)
+    return enforcer
+
+
 @pytest.mark.django_db
 @ddt
 class CasbinEnforcementTestCase(TestCase):
@@ -76,24 +103,22 @@ class CasbinEnforcementTestCase(TestCase):
 
     This test class loads the model.conf and the provided policies and runs
     enforcement tests for different user roles and permissions.
+
+    Subclasses define their rules in ``POLICY``, which is loaded once for the whole class
+    since only the requests vary between test cases.
     """
 
+    POLICY: list[list[str]] = []
+
     @classmethod
     def setUpClass(cls) -> None:
-        """Set up the Casbin enforcer."""
+        """Set up the Casbin enforcer and load the class policy."""
         super().setUpClass()
+        cls.enforcer = get_shared_enforcer()
+        cls._load_policy(cls.POLICY)
 
-        engine_config_dir = os.path.join(ROOT_DIRECTORY, "engine", "config")
-        model_file = os.path.join(engine_config_dir, "model.conf")
-
-        if not os.path.isfile(model_file):
-            raise FileNotFoundError(f"Model file not found: {model_file}")
-
-        cls.enforcer = casbin.Enforcer(model_file)
-        cls.enforcer.add_function("is_staff_or_superuser", is_admin_or_superuser_check)
-        cls.enforcer.add_named_domain_matching_func("g", key_match_func)
-
-    def _load_policy(self, policy: list[str]) -> None:
+    @classmethod
+    def _load_policy(cls, policy: list[str]) -> None:
         """
         Load policy rules into the Casbin enforcer.
 
@@ -109,31 +134,52 @@ class CasbinEnforcementTestCase(TestCase):
         Raises:
             ValueError: If a policy rule has an invalid type (not 'p', 'g', or 'g2').
         """
-        self.enforcer.clear_policy()
+        rules_by_ptype = {"p": [], "g": [], "g2": []}
         for rule in policy:
-            if rule[0] == "p":
-                self.enforcer.add_named_policy("p", rule[1:])
-            elif rule[0] == "g":
-                self.enforcer.add_named_grouping_policy("g", rule[1:])
-            elif rule[0] == "g2":
-                self.enforcer.add_named_grouping_policy("g2", rule[1:])
-            else:
+            if rule[0] not in rules_by_ptype:
                 raise ValueError(f"Invalid policy rule: {rule}")
-
-    def _test_enforcement(self, policy: list[str], request: AuthRequest) -> None:
+            rules_by_ptype[rule[0]].append(rule[1:])
+
+        cls.enforcer.clear_policy()
+        # Build the role links once after all the rules are added instead of after every batch.
+        # The rebuild also drops the links of the previously loaded policy, which clear_policy keeps.
+        cls.enforcer.enable_auto_build_role_links(False)
+        try:
+            if rules_by_ptype["p"]:
+                cls.enforcer.add_named_policies("p", rules_by_ptype["p"])
+            for ptype in ("g", "g2"):
+                if rules_by_ptype[ptype]:
+                    cls.enforcer.add_named_grouping_policies(ptype, rules_by_ptype[ptype])
+        finally:
+            cls.enforcer.enable_auto_build_role_links(True)
+        cls.enforcer.build_role_links()
+
+    def _test_enforcement(self, request: AuthRequest) -> None:
         """
-        Helper method to test enforcement and provide detailed feedback.
+        Helper method to test enforcement against the class policy and provide detailed feedback.
 
         Args:
-            policy (list[str]): A list of policy rules to load into the enforcer
             request (AuthRequest): An authorization request containing all necessary parameters
         """
-        self._load_policy(policy)
         subject, action, scope = request["subject"], request["action"], request["scope"]
         result = self.enforcer.enforce(subject, action, scope)
         error_msg = f"Request: {subject} {action} {scope}"
         self.assertEqual(result, request["expected_result"], error_msg)
 
+    def _test_batch_enforcement(self, requests: list[AuthRequest]) -> None:
+        """
+        Helper method to test a table of requests with a single batch_enforce call.
+
+        Args:
+            requests (list[AuthRequest]): The authorization requests to enforce together
+        """
+        results = self.enforcer.batch_enforce(
+            [[request["subject"], request["action"], request["scope"]] for request in requests]
+        )
+        for request, result in zip(requests, results, strict=True):
+            error_msg = f"Request: {request['subject']} {request['action']} {request['scope']}"
+            self.assertEqual(result, request["expected_result"], error_msg)
+
 
 @ddt
 class SystemWideRoleTests(CasbinEnforcementTestCase):
@@ -169,7 +215,15 @@ class SystemWideRoleTests(CasbinEnforcementTestCase):
     @data(*GENERAL_CASES)
     def test_platform_admin_general_access(self, request: AuthRequest):
         """Test that platform administrators have full access to all resources."""
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
+
+    def test_reloading_policy_drops_previous_role_links(self):
+        """Test that loading another policy doesn't keep the role assignments of the previous one."""
+        try:
+            self._load_policy([rule for rule in self.POLICY if rule[0] != "g"])
+            self._test_enforcement({**self.GENERAL_CASES[0], "expected_result": False})
+        finally:
+            self._load_policy(self.POLICY)
 
 
 @ddt
@@ -230,7 +284,7 @@ class ActionGroupingTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_action_grouping_access(self, request: AuthRequest):
         """Test that users have access through action grouping."""
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -416,7 +470,11 @@ class RoleAssignmentTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_role_assignment_access(self, request: AuthRequest):
         """Test that users have access through role assignment."""
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
+
+    def test_role_assignment_access_in_batch(self):
+        """Test that batch enforcement returns the same decisions as enforcing each request."""
+        self._test_batch_enforcement(self.CASES)
 
 
 @ddt
@@ -484,7 +542,7 @@ class DeniedAccessTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_denied_access(self, request: AuthRequest):
         """Test that users have denied access."""
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -531,7 +589,7 @@ class WildcardScopeTests(CasbinEnforcementTestCase):
             "scope": scope,
             "expected_result": expected_result,
         }
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
 
     @data(
         (make_course_key("course-v1:OpenedX+DemoX+CS101"), False),
@@ -546,7 +604,7 @@ class WildcardScopeTests(CasbinEnforcementTestCase):
             "scope": scope,
             "expected_result": expected_result,
         }
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -567,6 +625,8 @@ class OrgGlobCourseEnforcementTests(CasbinEnforcementTestCase):
         make_course_assignment("user1", roles.COURSE_STAFF.external_key, "course-v1:OpenedX+*"),
     ]
 
+    POLICY = POLICIES + ASSIGNMENTS
+
     CASES = [
         # Permission granted
         make_course_case("user1", COURSES_VIEW_COURSE.identifier, "course-v1:OpenedX+Python+2026", True),
@@ -582,7 +642,7 @@ class OrgGlobCourseEnforcementTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_org_level_glob_enforcement(self, request: AuthRequest):
         """Test that org-level glob patterns in course scopes are enforced correctly."""
-        self._test_enforcement(self.POLICIES + self.ASSIGNMENTS, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -603,6 +663,8 @@ class OrgGlobLibraryEnforcementTests(CasbinEnforcementTestCase):
         make_library_assignment("user1", roles.LIBRARY_ADMIN.external_key, "lib:DemoX:*"),
     ]
 
+    POLICY = POLICIES + ASSIGNMENTS
+
     CASES = [
         # Permission granted
         make_library_case("user1", VIEW_LIBRARY.identifier, "lib:DemoX:CS101", True),
@@ -618,7 +680,7 @@ class OrgGlobLibraryEnforcementTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_org_level_glob_enforcement(self, request: AuthRequest):
         """Test that org-level glob patterns in library scopes are enforced correctly."""
-        self._test_enforcement(self.POLICIES + self.ASSIGNMENTS, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -639,6 +701,8 @@ class PlatformGlobCourseEnforcementTests(CasbinEnforcementTestCase):
         make_course_assignment("user1", roles.COURSE_STAFF.external_key, "course-v1:*"),
     ]
 
+    POLICY = POLICIES + ASSIGNMENTS
+
     CASES = [
         # Permission granted across organizations
         make_course_case("user1", COURSES_VIEW_COURSE.identifier, "course-v1:OpenedX+Python+2026", True),
@@ -653,7 +717,7 @@ class PlatformGlobCourseEnforcementTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_platform_level_glob_enforcement(self, request: AuthRequest):
         """Test that platform-level glob patterns in course scopes are enforced correctly."""
-        self._test_enforcement(self.POLICIES + self.ASSIGNMENTS, request)
+        self._test_enforcement(request)
 
 
 @ddt
@@ -675,6 +739,8 @@ class PlatformGlobLibraryEnforcementTests(CasbinEnforcementTestCase):
         make_library_assignment("user1", roles.LIBRARY_ADMIN.external_key, "lib:*"),
     ]
 
+    POLICY = POLICIES + ASSIGNMENTS
+
     CASES = [
         # Permission granted
         make_library_case("user1", MANAGE_LIBRARY_TEAM.identifier, "lib:*", True),
@@ -694,7 +760,7 @@ class PlatformGlobLibraryEnforcementTests(CasbinEnforcementTestCase):
     @data(*CASES)
     def test_platform_level_glob_enforcement(self, request: AuthRequest):
         """Test that platform-level glob patterns in library scopes are enforced correctly."""
-        self._test_enforcement(self.POLICIES + self.ASSIGNMENTS, request)
+        self._test_enforcement(request)
 
 
 @pytest.mark.django_db
@@ -714,9 +780,9 @@ class StaffSuperuserAccessTests(CasbinEnforcementTestCase):
     def setUp(self) -> None:
         """Set up the test environment."""
         super().setUp()
-        User.objects.create_user(username="staff_user", email="staff@example.com", password="test", is_staff=True)
-        User.objects.create_superuser(username="superuser", email="super@example.com", password="test")
-        User.objects.create_user(username="regular_user", email="regular@example.com", password="test")
+        User.objects.create_user(username="staff_user", email="staff@example.com", is_staff=True)
+        User.objects.create_superuser(username="superuser", email="super@example.com")
+        User.objects.create_user(username="regular_user", email="regular@example.com")
 
     @data(
         # Staff user has automatic access to any library scope
@@ -781,7 +847,7 @@ class StaffSuperuserAccessTests(CasbinEnforcementTestCase):
             - Regular users are denied access without role assignments
         """
         request = {"subject": subject, "action": action, "scope": scope, "expected_result": expected_result}
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
 
 
 @pytest.mark.django_db
@@ -800,9 +866,9 @@ class AdminOrSuperuserMatcherTests(CasbinEnforcementTestCase):
     def setUp(self) -> None:
         """Set up staff, superuser, and regular user."""
         super().setUp()
-        User.objects.create_user(username="staff_user", email="staff@example.com", password="test", is_staff=True)
-        User.objects.create_superuser(username="superuser", email="super@example.com", password="test")
-        User.objects.create_user(username="regular_user", email="regular@example.com", password="test")
+        User.objects.create_user(username="staff_user", email="staff@example.com", is_staff=True)
+        User.objects.create_superuser(username="superuser", email="super@example.com")
+        User.objects.create_user(username="regular_user", email="regular@example.com")
 
     @data(
         # ContentLibraryData scope
@@ -919,6 +985,19 @@ class AdminOrSuperuserMatcherTests(CasbinEnforcementTestCase):
             make_library_key("lib:*"),
             False,
         ),
+        # Unsupported scope type (CCX) is denied even for staff/superusers
+        (
+            make_user_key("staff_user"),
+            make_action_key("courses.view_course"),
+            CCXCourseOverviewData(external_key="ccx-v1:TestOrg+TestCourse+2024+ccx@1").namespaced_key,
+            False,
+        ),
+        (
+            make_user_key("superuser"),
+            make_action_key("courses.view_course"),
+            CCXCourseOverviewData(external_key="ccx-v1:TestOrg+TestCourse+2024+ccx@1").namespaced_key,
+            False,
+        ),
     )
     @unpack
     def test_is_admin_or_superuser_check(
@@ -944,4 +1023,40 @@ class AdminOrSuperuserMatcherTests(CasbinEnforcementTestCase):
             - staff_user and superuser: False for unsupported scope types.
         """
         request = {"subject": subject, "action": action, "scope": scope, "expected_result": expected_result}
-        self._test_enforcement(self.POLICY, request)
+        self._test_enforcement(request)
+
+    @data(
+        (make_library_key("lib:TestOrg:TestLib"), True),
+        (make_course_key("course-v1:*"), True),
+        (CCXCourseOverviewData(external_key="ccx-v1:TestOrg+TestCourse+2024+ccx@1").namespaced_key, False),
+    )
+    @unpack
+    def test_scope_requires_admin_or_superuser_check_is_memoized(self, scope: str, expected_result: bool):
+        """Test the scope check result is computed once per scope and then reused.
+
+        Expected result:
+            - The scope check returns the expected result on every call.
+            - Repeated calls for the same scope are served from the cache.
+        """
+        scope_requires_admin_or_superuser_check.cache_clear()
+
+        results = [scope_requires_admin_or_superuser_check(scope) for _ in range(3)]
+
+        self.assertEqual(results, [expected_result] * 3)
+        self.assertEqual(scope_requires_admin_or_superuser_check.cache_info().misses, 1)
+        self.assertEqual(scope_requires_admin_or_superuser_check.cache_info().hits, 2)
+
+    @data(
+        GLOBAL_SCOPE_WILDCARD,
+        "lib",
+        "lib^",
+        "unknown^TestOrg",
+    )
+    def test_is_admin_or_superuser_check_rejects_malformed_scopes(self, scope: str):
+        """Test the staff/superuser check raises for wildcard, malformed and unknown scope keys.
+
+        Expected result:
+            - ValueError is raised instead of silently denying access.
+        """
+        with self.assertRaises(ValueError):
+            is_admin_or_superuser_check(make_user_key("staff_user"), make_action_key("courses.view_course"), scope)
@@ -6,15 +6,18 @@ that would be used in production environments.
 """
 
 import time
+from unittest.mock import patch
 from uuid import uuid4
 
 import casbin
+from crum import set_current_request
 from ddt import data as ddt_data
 from ddt import ddt
 from django.conf import settings
-from django.test import TestCase, TransactionTestCase, override_settings
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from edx_django_utils.cache import RequestCache
 
-from openedx_authz.engine.enforcer import AuthzEnforcer
+from openedx_authz.engine.enforcer import DECISION_CACHE_NAMESPACE, AuthzEnforcer
 from openedx_authz.engine.filter import Filter
 from openedx_authz.engine.utils import migrate_policy_between_enforcers
 from openedx_authz.models.engine import PolicyCacheControl
@@ -636,6 +639,117 @@ class TestEnforcerPolicyCacheBehavior(TransactionTestCase):
             current_version,
         )
 
+    @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
+    def test_load_policy_if_needed_checks_version_once_per_request(self):
+        """Test that the cache version is only queried once within the same request.
+
+        Expected result:
+            - After the first check, getting the enforcer doesn't query the database
+            - A version changed elsewhere is picked up once the request cache is cleared
+        """
+        set_current_request(RequestFactory().get("/"))
+        self.addCleanup(set_current_request, None)
+        RequestCache.clear_all_namespaces()
+        AuthzEnforcer.get_enforcer()
+
+        with self.assertNumQueries(0):
+            AuthzEnforcer.get_enforcer()
+
+        new_version = uuid4()
+        PolicyCacheControl.set_version(new_version)
+        RequestCache.clear_all_namespaces()
+
+        AuthzEnforcer.get_enforcer()
+
+        self.assertEqual(
+            AuthzEnforcer._last_policy_loaded_version,  # pylint: disable=protected-access
+            new_version,
+        )
+
+    @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
+    def test_load_policy_if_needed_checks_version_on_every_call_outside_requests(self):
+        """Test that the cache version isn't memoized when there is no current request.
+
+        Outside of a request (e.g., in Celery workers) nothing clears the request cache,
+        so a memoized version would never be checked again.
+
+        Expected result:
+            - A version changed elsewhere is picked up without clearing the request cache
+        """
+        RequestCache.clear_all_namespaces()
+        AuthzEnforcer.get_enforcer()
+
+        new_version = uuid4()
+        PolicyCacheControl.set_version(new_version)
+
+        with self.assertNumQueries(2):
+            AuthzEnforcer.get_enforcer()
+
+        self.assertEqual(
+            AuthzEnforcer._last_policy_loaded_version,  # pylint: disable=protected-access
+            new_version,
+        )
+
+    @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
+    def test_policy_reload_clears_decision_cache(self):
+        """Test that decisions memoized for a previous policy version are evicted on reload.
+
+        Expected result:
+            - Decisions cached before the reload are no longer in the request cache
+        """
+        RequestCache.clear_all_namespaces()
+        AuthzEnforcer.get_enforcer()
+        decision_cache = RequestCache(DECISION_CACHE_NAMESPACE)
+        decision_cache.set("stale-decision", True)
+
+        PolicyCacheControl.set_version(uuid4())
+        AuthzEnforcer.get_enforcer()
+
+        self.assertFalse(decision_cache.get_cached_response("stale-decision").is_found)
+
+    @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
+    def test_force_reload_loads_policy_once(self):
+        """Test that force_reload reloads the policy right away through the version check.
+
+        Expected result:
+            - The policy is loaded exactly once, including the checks that follow
+            - The loaded version matches the new version in the cache control model
+            - Memoized decisions are cleared
+        """
+        RequestCache.clear_all_namespaces()
+        enforcer = AuthzEnforcer.get_enforcer()
+        decision_cache = RequestCache(DECISION_CACHE_NAMESPACE)
+        decision_cache.set("stale-decision", True)
+
+        with patch.object(enforcer, "load_policy", wraps=enforcer.load_policy) as mock_load_policy:
+            AuthzEnforcer.force_reload()
+            AuthzEnforcer.get_enforcer()
+
+        mock_load_policy.assert_called_once()
+        self.assertEqual(
+            AuthzEnforcer._last_policy_loaded_version,  # pylint: disable=protected-access
+            PolicyCacheControl.get_version(),
+        )
+        self.assertFalse(decision_cache.get_cached_response("stale-decision").is_found)
+
+    @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
+    def test_invalidate_policy_cache_forces_version_check(self):
+        """Test that invalidating the policy cache makes the next check reload the policy.
+
+        Expected result:
+            - The policy is reloaded to the new version within the same request
+        """
+        RequestCache.clear_all_namespaces()
+        AuthzEnforcer.get_enforcer()
+
+        AuthzEnforcer.invalidate_policy_cache()
+        AuthzEnforcer.get_enforcer()
+
+        self.assertEqual(
+            AuthzEnforcer._last_policy_loaded_version,  # pylint: disable=protected-access
+            PolicyCacheControl.get_version(),
+        )
+
     @override_settings(CASBIN_AUTO_LOAD_POLICY_INTERVAL=0)
     def test_invalidate_policy_cache(self):
         """Test that invalidate_policy_cache updates the cache invalidation model.
@@ -9,6 +9,8 @@ management command.
 import os
 
 import casbin
+from casbin import persist
+from casbin_adapter.adapter import Adapter
 from casbin_adapter.models import CasbinRule
 from ddt import data, ddt, unpack
 from django.db.models import Count
@@ -21,6 +23,23 @@ from openedx_authz.engine.utils import migrate_policy_between_enforcers
 from openedx_authz.tests.test_utils import make_action_key, make_role_key, make_scope_key, make_user_key
 
 
+class SingleRuleAdapter(persist.Adapter):
+    """In-memory adapter that can only persist rules one at a time (no ``add_policies``)."""
+
+    def __init__(self):
+        self.rules = []
+
+    def load_policy(self, model):
+        """Load the persisted rules into the model."""
+        for sec, ptype, rule in self.rules:
+            model.add_policy(sec, ptype, rule)
+
+    def add_policy(self, sec, ptype, rule):
+        """Persist a single rule."""
+        self.rules.append((sec, ptype, rule))
+        return True
+
+
 @ddt
 class TestMigratePolicyBetweenEnforcers(TestCase):
     """
@@ -46,16 +65,17 @@ class TestMigratePolicyBetweenEnforcers(TestCase):
         if not os.path.isfile(cls.policy_file):
             raise FileNotFoundError(f"Policy file not found: {cls.policy_file}")
 
+        # Source enforcer loads policies from the authz.policy file. It is read-only and
+        # reloaded from the file by every migration, so it is shared by all the tests.
+        cls.source_enforcer = casbin.Enforcer(cls.model_file, cls.policy_file)
+
     def setUp(self):
-        """Set up fresh enforcers for each test.
+        """Set up the enforcers for each test.
 
-        Creates enforcers matching the load_policies command pattern:
+        Uses enforcers matching the load_policies command pattern:
         - Source enforcer: file-based (loads from authz.policy file, read-only)
         - Target enforcer: database-backed (global_enforcer, will be cleared)
         """
-        # Source enforcer loads policies from the authz.policy file
-        self.source_enforcer = casbin.Enforcer(self.model_file, self.policy_file)
-
         # Target enforcer is the database-backed global enforcer
         self.target_enforcer = AuthzEnforcer.get_enforcer()
 
@@ -230,6 +250,52 @@ class TestMigratePolicyBetweenEnforcers(TestCase):
             "Should have 10 g2 rules from file",
         )
 
+    def test_migrate_persists_batched_policies_to_database(self):
+        """Test that policies added in batch are persisted to the database.
+
+        Expected Result:
+            - All regular policies (p) are stored as CasbinRule rows (116 rules)
+            - All action inheritance rules (g2) are stored as CasbinRule rows (10 rules)
+        """
+        migrate_policy_between_enforcers(self.source_enforcer, self.target_enforcer)
+
+        self.assertEqual(CasbinRule.objects.filter(ptype="p").count(), 116)
+        self.assertEqual(CasbinRule.objects.filter(ptype="g2").count(), 10)
+
+    def test_batched_policy_removal_persists_to_database(self):
+        """Test that policies removed in batch are deleted from the database.
+
+        Expected Result:
+            - All action inheritance rules (g2) are deleted from the database
+            - Regular policies (p) are left untouched
+        """
+        migrate_policy_between_enforcers(self.source_enforcer, self.target_enforcer)
+
+        grouping_policies = list(self.target_enforcer.get_named_grouping_policy("g2"))
+        self.target_enforcer.remove_named_grouping_policies("g2", grouping_policies)
+
+        self.assertEqual(CasbinRule.objects.filter(ptype="g2").count(), 0)
+        self.assertEqual(CasbinRule.objects.filter(ptype="p").count(), 116)
+
+    def test_loaded_policies_match_base_adapter(self):
+        """Test that the extended adapter loads the same policies as the base Django adapter.
+
+        Expected Result:
+            - Regular policies (p), role assignments (g) and action inheritance rules (g2)
+              are identical to the ones loaded through CasbinRule string parsing
+        """
+        migrate_policy_between_enforcers(self.source_enforcer, self.target_enforcer)
+        base_enforcer = casbin.Enforcer(self.model_file, Adapter())
+
+        self.target_enforcer.load_policy()
+
+        self.assertEqual(self.target_enforcer.get_policy(), base_enforcer.get_policy())
+        for ptype in ("g", "g2"):
+            self.assertEqual(
+                self.target_enforcer.get_named_grouping_policy(ptype),
+                base_enforcer.get_named_grouping_policy(ptype),
+            )
+
     def test_migrate_partial_duplicates(self):
         """Test migration when database already has some policies from the file.
 
@@ -383,3 +449,24 @@ class TestMigratePolicyBetweenEnforcers(TestCase):
 
         target_policies = self.target_enforcer.get_policy()
         self.assertEqual(len(target_policies), 116, "All 116 policies from file should be loaded")
+
+    def test_migrate_to_adapter_without_batch_support(self):
+        """Test that migration falls back to adding rules one by one when batches aren't supported.
+
+        Expected Result:
+            - Every regular policy (p) and action inheritance rule (g2) is persisted
+            - The logged count matches the number of rules actually added
+        """
+        adapter = SingleRuleAdapter()
+        target_enforcer = casbin.Enforcer(self.model_file, adapter)
+
+        with self.assertLogs("openedx_authz.engine.utils", level="INFO") as logs:
+            migrate_policy_between_enforcers(self.source_enforcer, target_enforcer)
+
+        self.assertEqual(len([rule for _, ptype, rule in adapter.rules if ptype == "p"]), 116)
+        self.assertEqual(len([rule for _, ptype, rule in adapter.rules if ptype == "g2"]), 10)
+        self.assertIn("INFO:openedx_authz.engine.utils:Added 116 policies to target enforcer.", logs.output)
+        self.assertIn(
+            "INFO:openedx_authz.engine.utils:Added 10 g2 grouping policies to target enforcer.",
+            logs.output,
+        )
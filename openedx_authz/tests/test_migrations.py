@@ -6,6 +6,7 @@ from ddt import data, ddt, unpack
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.core.management import CommandError, call_command
+from django.db import connection
 from django.test import TestCase
 from opaque_keys.edx.django.models import CourseKeyField
 
@@ -73,6 +74,23 @@ error_group_name = f"{OBJECT_PREFIX}error_group"
 empty_group_name = f"{OBJECT_PREFIX}empty_group"
 
 
+class TestCasbinRuleIndexMigration(TestCase):
+    """Test case for the casbin_rule composite index migration."""
+
+    def test_casbin_rule_index_created(self):
+        """Test that the composite index on the casbin_rule table exists after migrating.
+
+        Expected Result:
+            - The casbin_rule table has an index on (ptype, v0, v1)
+        """
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, "casbin_rule")
+
+        self.assertIn("casbin_rule_ptype_v0_v1_idx", constraints)
+        self.assertTrue(constraints["casbin_rule_ptype_v0_v1_idx"]["index"])
+        self.assertEqual(constraints["casbin_rule_ptype_v0_v1_idx"]["columns"], ["ptype", "v0", "v1"])
+
+
 class TestLegacyContentLibraryPermissionsMigration(TestCase):
     """Test cases for migrating legacy content library permissions."""
 
@@ -92,54 +110,59 @@ class TestLegacyContentLibraryPermissionsMigration(TestCase):
         library = ContentLibrary.objects.create(org=org, slug=lib_name)
 
         # Create Users and Groups
-        users = [
-            User.objects.create_user(username=user_name, email=f"{user_name}@example.com") for user_name in user_names
-        ]
+        User.objects.bulk_create(
+            [
+                User(username=user_name, email=f"{user_name}@example.com")
+                for user_name in user_names + group_user_names + [error_user_name]
+            ]
+        )
+        users_by_name = User.objects.in_bulk(user_names + group_user_names + [error_user_name], field_name="username")
+        users = [users_by_name[user_name] for user_name in user_names]
+        group_users = [users_by_name[user_name] for user_name in group_user_names]
+        error_user = users_by_name[error_user_name]
 
-        group_users = [
-            User.objects.create_user(username=user_name, email=f"{user_name}@example.com")
-            for user_name in group_user_names
-        ]
         group = Group.objects.create(name=group_name)
         group.user_set.set(group_users)
 
-        error_user = User.objects.create_user(username=error_user_name, email=f"{error_user_name}@example.com")
         error_group = Group.objects.create(name=error_group_name)
         error_group.user_set.set([error_user])
 
         empty_group = Group.objects.create(name=empty_group_name)
 
-        # Assign legacy permissions for users and group
-        for user in users:
-            ContentLibraryPermission.objects.create(
-                user=user,
-                library=library,
-                access_level=ContentLibraryPermission.ADMIN_LEVEL,
-            )
-
-        ContentLibraryPermission.objects.create(
-            group=group,
-            library=library,
-            access_level=ContentLibraryPermission.READ_LEVEL,
-        )
-
-        # Create invalid permissions for testing error logging
-        ContentLibraryPermission.objects.create(
-            user=error_user,
-            library=library,
-            access_level="invalid",
-        )
-        ContentLibraryPermission.objects.create(
-            group=error_group,
-            library=library,
-            access_level="invalid",
-        )
-
-        # Edge case: empty group with no users
-        ContentLibraryPermission.objects.create(
-            group=empty_group,
-            library=library,
-            access_level=ContentLibraryPermission.READ_LEVEL,
+        ContentLibraryPermission.objects.bulk_create(
+            [
+                # Assign legacy permissions for users and group
+                *[
+                    ContentLibraryPermission(
+                        user=user,
+                        library=library,
+                        access_level=ContentLibraryPermission.ADMIN_LEVEL,
+                    )
+                    for user in users
+                ],
+                ContentLibraryPermission(
+                    group=group,
+                    library=library,
+                    access_level=ContentLibraryPermission.READ_LEVEL,
+                ),
+                # Create invalid permissions for testing error logging
+                ContentLibraryPermission(
+                    user=error_user,
+                    library=library,
+                    access_level="invalid",
+                ),
+                ContentLibraryPermission(
+                    group=error_group,
+                    library=library,
+                    access_level="invalid",
+                ),
+                # Edge case: empty group with no users
+                ContentLibraryPermission(
+                    group=empty_group,
+                    library=library,
+                    access_level=ContentLibraryPermission.READ_LEVEL,
+                ),
+            ]
         )
 
     def tearDown(self):
@@ -148,7 +171,6 @@ class TestLegacyContentLibraryPermissionsMigration(TestCase):
         """
         super().tearDown()
 
-        AuthzEnforcer.get_enforcer().load_policy()
         batch_unassign_role_from_users(
             users=user_names,
             role_external_key=LIBRARY_ADMIN.external_key,
@@ -162,11 +184,8 @@ class TestLegacyContentLibraryPermissionsMigration(TestCase):
 
         ContentLibrary.objects.filter(slug=lib_name).delete()
         Organization.objects.filter(name=org_name).delete()
-        Group.objects.filter(name=group_name).delete()
-        Group.objects.filter(name=error_group_name).delete()
-        Group.objects.filter(name=empty_group_name).delete()
-        for user_name in user_names + group_user_names + [error_user_name]:
-            User.objects.filter(username=user_name).delete()
+        Group.objects.filter(name__in=[group_name, error_group_name, empty_group_name]).delete()
+        User.objects.filter(username__in=user_names + group_user_names + [error_user_name]).delete()
 
     def test_migration(self):
         """Test the migration of legacy permissions.
@@ -226,77 +245,34 @@ class TestLegacyCourseAuthoringPermissionsMigration(TestCase):
             id=self.course_id, org=self.org, display_name=f"{OBJECT_PREFIX} Course"
         )
 
-        # Create lists to hold legacy role objects for cleanup and verification purposes
-        self.admin_legacy_roles = []
-        self.staff_legacy_roles = []
-        self.limited_staff_legacy_roles = []
-        self.data_researcher_legacy_roles = []
-
         # Create users for each legacy role and an additional user for testing invalid permissions
-        self.admin_users = [
-            User.objects.create_user(username=f"admin_{user_name}", email=f"admin_{user_name}@example.com")
-            for user_name in user_names
-        ]
-
-        self.staff_users = [
-            User.objects.create_user(username=f"staff_{user_name}", email=f"staff_{user_name}@example.com")
-            for user_name in user_names
-        ]
-
-        self.limited_staff = [
-            User.objects.create_user(
-                username=f"limited_staff_{user_name}", email=f"limited_staff_{user_name}@example.com"
-            )
-            for user_name in user_names
-        ]
-
-        self.data_researcher = [
-            User.objects.create_user(
-                username=f"data_researcher_{user_name}", email=f"data_researcher_{user_name}@example.com"
-            )
-            for user_name in user_names
-        ]
-
-        self.error_user = User.objects.create_user(username=error_user_name, email=f"{error_user_name}@example.com")
-
-        # Assign legacy permissions for users based on their role
-        for user in self.admin_users:
-            leg_role = CourseAccessRole.objects.create(
-                **default_course_fields,
-                user=user,
-                role="instructor",
-            )
-            self.admin_legacy_roles.append(leg_role)
-
-        for user in self.staff_users:
-            leg_role = CourseAccessRole.objects.create(
-                **default_course_fields,
-                user=user,
-                role="staff",
-            )
-            self.staff_legacy_roles.append(leg_role)
+        users_by_role = {
+            "instructor": [f"admin_{user_name}" for user_name in user_names],
+            "staff": [f"staff_{user_name}" for user_name in user_names],
+            "limited_staff": [f"limited_staff_{user_name}" for user_name in user_names],
+            "data_researcher": [f"data_researcher_{user_name}" for user_name in user_names],
+            "invalid-legacy-role": [error_user_name],
+        }
+        all_user_names = [username for usernames in users_by_role.values() for username in usernames]
+        User.objects.bulk_create(
+            [User(username=username, email=f"{username}@example.com") for username in all_user_names]
+        )
+        users_by_name = User.objects.in_bulk(all_user_names, field_name="username")
 
-        for user in self.limited_staff:
-            leg_role = CourseAccessRole.objects.create(
-                **default_course_fields,
-                user=user,
-                role="limited_staff",
-            )
-            self.limited_staff_legacy_roles.append(leg_role)
+        self.admin_users = [users_by_name[username] for username in users_by_role["instructor"]]
+        self.staff_users = [users_by_name[username] for username in users_by_role["staff"]]
+        self.limited_staff = [users_by_name[username] for username in users_by_role["limited_staff"]]
+        self.data_researcher = [users_by_name[username] for username in users_by_role["data_researcher"]]
+        self.error_user = users_by_name[error_user_name]
 
-        for user in self.data_researcher:
-            leg_role = CourseAccessRole.objects.create(
-                **default_course_fields,
-                user=user,
-                role="data_researcher",
-            )
-            self.data_researcher_legacy_roles.append(leg_role)
-
-        # Create invalid permission for testing error logging
-        CourseAccessRole.objects.create(
-            **default_course_fields,
-            user=self.error_user,
-            role="invalid-legacy-role",
+        # Assign legacy permissions for users based on their role, including the invalid permission
+        # used for testing error logging
+        CourseAccessRole.objects.bulk_create(
+            [
+                CourseAccessRole(**default_course_fields, user=users_by_name[username], role=role)
+                for role, usernames in users_by_role.items()
+                for username in usernames
+            ]
         )
 
         class MockPermission:
@@ -349,7 +325,6 @@ class TestLegacyCourseAuthoringPermissionsMigration(TestCase):
         Clean up test data created for the migration test.
         """
         super().tearDown()
-        AuthzEnforcer.get_enforcer().load_policy()
 
         admin_users_names = [user.username for user in self.admin_users]
         staff_users_names = [user.username for user in self.staff_users]
@@ -1321,25 +1296,29 @@ class TestLegacyCourseAuthoringPermissionsMigration(TestCase):
         library = ContentLibrary.objects.create(org=org, slug=lib_name)
 
         # Create Groups
-        group_users = [
-            User.objects.create_user(username=user_name, email=f"{user_name}@example.com")
-            for user_name in group_user_names
-        ]
+        User.objects.bulk_create(
+            [User(username=user_name, email=f"{user_name}@example.com") for user_name in group_user_names]
+        )
         group = Group.objects.create(name=group_name)
-        group.user_set.set(group_users)
+        group.user_set.set(User.objects.filter(username__in=group_user_names))
 
         # Assign legacy permissions for users and group
-        for user in self.admin_users + self.staff_users + self.limited_staff + self.data_researcher:
-            ContentLibraryPermission.objects.create(
-                user=user,
-                library=library,
-                access_level=ContentLibraryPermission.ADMIN_LEVEL,
-            )
-
-        ContentLibraryPermission.objects.create(
-            group=group,
-            library=library,
-            access_level=ContentLibraryPermission.READ_LEVEL,
+        ContentLibraryPermission.objects.bulk_create(
+            [
+                ContentLibraryPermission(
+                    user=user,
+                    library=library,
+                    access_level=ContentLibraryPermission.ADMIN_LEVEL,
+                )
+                for user in self.admin_users + self.staff_users + self.limited_staff + self.data_researcher
+            ]
+            + [
+                ContentLibraryPermission(
+                    group=group,
+                    library=library,
+                    access_level=ContentLibraryPermission.READ_LEVEL,
+                )
+            ]
         )
 
     @patch("openedx_authz.api.data.CourseOverview", CourseOverview)
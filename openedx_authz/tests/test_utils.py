@@ -4,6 +4,7 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from ddt import data, ddt, unpack
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from openedx_authz.api.data import (
@@ -15,7 +16,10 @@ from openedx_authz.api.data import (
     ScopeData,
     UserData,
 )
-from openedx_authz.utils import get_waffle_flag_states
+from openedx_authz.tests.stubs.models import UserProfile
+from openedx_authz.utils import get_user_by_username_or_email, get_waffle_flag_states
+
+User = get_user_model()
 
 FLAG_NAME = "authz.enable_course_authoring"
 
@@ -322,3 +326,60 @@ class TestGetWaffleFlagStates(TestCase):
                     "course_overrides": {"on": [], "off": []},
                 },
             )
+
+
+@ddt
+class TestGetUserByUsernameOrEmail(TestCase):
+    """Test cases for the get_user_by_username_or_email function."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", email="alice@example.com")
+
+    @data("alice", "alice@example.com")
+    def test_get_user_by_username_or_email(self, username_or_email):
+        """Test that a user is found by either username or email in a single query.
+
+        Expected result:
+            - The matching user is returned
+        """
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_by_username_or_email(username_or_email), self.user)
+
+    def test_get_unknown_user_raises_does_not_exist(self):
+        """Test that looking up an unknown user raises User.DoesNotExist."""
+        with self.assertRaises(User.DoesNotExist):
+            get_user_by_username_or_email("unknown")
+
+    def test_retired_user_is_checked_in_the_same_query(self):
+        """Test that users with a retirement request are rejected without an extra query.
+
+        The retirement model only exists in edx-platform, so the stub profile model stands in
+        for it since it also holds a one-to-one relation to the user.
+
+        Expected result:
+            - A user with a related retirement row raises User.DoesNotExist
+            - The retirement check adds no query to the lookup
+        """
+        with patch("openedx_authz.utils._get_user_retirement_model", return_value=UserProfile):
+            with self.assertNumQueries(1):
+                self.assertEqual(get_user_by_username_or_email("alice"), self.user)
+
+            UserProfile.objects.create(user=self.user)
+
+            with self.assertNumQueries(1), self.assertRaises(User.DoesNotExist):
+                get_user_by_username_or_email("alice")
+
+    def test_user_matching_both_username_and_email_is_returned_once(self):
+        """Test that a user whose username equals their email is not reported as a duplicate."""
+        user = User.objects.create_user(username="bob@example.com", email="bob@example.com")
+
+        self.assertEqual(get_user_by_username_or_email("bob@example.com"), user)
+
+    def test_username_and_email_of_different_users_is_ambiguous(self):
+        """Test that a key matching one user's username and another user's email is rejected."""
+        User.objects.create_user(username="carol@example.com", email="carol@example.org")
+        User.objects.create_user(username="carol", email="carol@example.com")
+
+        with self.assertRaises(User.MultipleObjectsReturned):
+            get_user_by_username_or_email("carol@example.com")
@@ -1,7 +1,10 @@
 """General utility functions for Open edX AuthZ."""
 
+import functools
+
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Exists, OuterRef
 from edx_django_utils.cache import RequestCache
 
 try:
@@ -49,6 +52,23 @@ def is_user_staff_or_superuser(username: str) -> bool:
     return result
 
 
+@functools.cache
+def _get_user_retirement_model():
+    """
+    Get the model that stores user retirement requests, if it is installed.
+
+    The model belongs to edx-platform, so it is resolved through the reverse relation on the
+    User model instead of being imported.
+
+    Returns:
+        type[Model] | None: The retirement request model, or None if the relation does not exist.
+    """
+    try:
+        return User._meta.get_field("userretirementrequest").related_model
+    except FieldDoesNotExist:
+        return None
+
+
 def get_user_by_username_or_email(username_or_email: str) -> User:
     """
     Retrieve a user by their username or email address.
@@ -63,8 +83,17 @@ def get_user_by_username_or_email(username_or_email: str) -> User:
         User.DoesNotExist: If no user matches the provided username or email,
             or if the user has an associated retirement request.
     """
-    user = User.objects.get(Q(email=username_or_email) | Q(username=username_or_email))
-    if hasattr(user, "userretirementrequest"):
+    users = User.objects.all()
+    retirement_model = _get_user_retirement_model()
+    if retirement_model is not None:
+        # Check the retirement request in the same query instead of a lazy per-user lookup
+        users = users.annotate(is_retired=Exists(retirement_model.objects.filter(user=OuterRef("pk"))))
+
+    # A UNION of two single-column lookups lets each branch use its own index, which an OR across
+    # both columns doesn't allow on every database. UNION also drops the duplicate row when the
+    # same user matches both, so the results are the same as with the OR.
+    user = users.filter(username=username_or_email).union(users.filter(email=username_or_email)).get()
+    if getattr(user, "is_retired", False):
         raise User.DoesNotExist
     return user
 